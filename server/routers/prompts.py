@@ -29,7 +29,7 @@ async def list_prompts() -> List[Dict[str, str]]:
         prompts.append(
           {'name': prompt_name, 'description': description, 'filename': prompt_file.name}
         )
-      except Exception:
+      except (OSError, UnicodeDecodeError):
         # If error reading, still include the prompt
         prompts.append(
           {
@@ -1,9 +1,13 @@
 """Data management MCP tools for Databricks."""
 
-import os
+import logging
 
 from databricks.sdk import WorkspaceClient
 
+from .utils import get_workspace_client
+
+logger = logging.getLogger(__name__)
+
 
 def load_data_tools(mcp_server):
   """Register data management MCP tools with the server.
@@ -24,9 +28,7 @@ def load_data_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # List files in DBFS
       files = w.dbfs.list(path)
@@ -51,8 +53,8 @@ def load_data_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error listing DBFS files: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}', 'files': [], 'count': 0}
+      logger.error('Error listing DBFS files: %s', e)
+      return {'success': False, 'error': f'Error: {e}', 'files': [], 'count': 0}
 
   @mcp_server.tool()
   def get_dbfs_file_info(path: str) -> dict:
@@ -66,9 +68,7 @@ def load_data_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Get file info
       file_info = w.dbfs.get_status(path)
@@ -86,8 +86,8 @@ def load_data_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error getting DBFS file info: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error getting DBFS file info: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def read_dbfs_file(path: str, offset: int = 0, length: int = None) -> dict:
@@ -103,9 +103,7 @@ def load_data_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Read file content
       if length:
@@ -133,8 +131,8 @@ def load_data_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error reading DBFS file: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error reading DBFS file: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def write_dbfs_file(path: str, content: str, overwrite: bool = False) -> dict:
@@ -150,9 +148,7 @@ def load_data_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Convert string to bytes
       content_bytes = content.encode('utf-8')
@@ -169,8 +165,8 @@ def load_data_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error writing DBFS file: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error writing DBFS file: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def delete_dbfs_path(path: str, recursive: bool = False) -> dict:
@@ -185,9 +181,7 @@ def load_data_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Delete path
       w.dbfs.delete(path, recursive=recursive)
@@ -200,8 +194,8 @@ def load_data_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error deleting DBFS path: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error deleting DBFS path: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def create_dbfs_directory(path: str) -> dict:
@@ -215,9 +209,7 @@ def load_data_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Create directory
       w.dbfs.mkdirs(path)
@@ -229,8 +221,8 @@ def load_data_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error creating DBFS directory: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error creating DBFS directory: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def move_dbfs_path(source: str, destination: str) -> dict:
@@ -245,9 +237,7 @@ def load_data_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Move path
       w.dbfs.move(source, destination)
@@ -260,8 +250,8 @@ def load_data_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error moving DBFS path: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error moving DBFS path: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def copy_dbfs_file(source_path: str, destination_path: str) -> dict:
@@ -276,9 +266,7 @@ def load_data_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Read source file
       with w.dbfs.read(source_path) as reader:
@@ -296,8 +284,8 @@ def load_data_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error copying DBFS file: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error copying DBFS file: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def list_external_locations() -> dict:
@@ -308,9 +296,7 @@ def load_data_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # List external locations
       locations = w.external_locations.list()
@@ -337,8 +323,8 @@ def load_data_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error listing external locations: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}', 'locations': [], 'count': 0}
+      logger.error('Error listing external locations: %s', e)
+      return {'success': False, 'error': f'Error: {e}', 'locations': [], 'count': 0}
 
   @mcp_server.tool()
   def list_volumes(catalog_name: str, schema_name: str) -> dict:
@@ -353,9 +339,7 @@ def load_data_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # List volumes in the schema
       volumes = w.volumes.list(catalog_name=catalog_name, schema_name=schema_name)
@@ -385,8 +369,8 @@ def load_data_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error listing volumes: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}', 'volumes': [], 'count': 0}
+      logger.error('Error listing volumes: %s', e)
+      return {'success': False, 'error': f'Error: {e}', 'volumes': [], 'count': 0}
 
   @mcp_server.tool()
   def create_volume(
@@ -412,9 +396,7 @@ def load_data_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Prepare volume configuration
       volume_config = {
@@ -440,8 +422,8 @@ def load_data_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error creating volume: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error creating volume: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def describe_external_location(location_name: str) -> dict:
@@ -455,9 +437,7 @@ def load_data_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Get external location details
       location = w.external_locations.get(location_name)
@@ -479,8 +459,8 @@ def load_data_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error describing external location: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error describing external location: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def list_storage_credentials() -> dict:
@@ -491,9 +471,7 @@ def load_data_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # List storage credentials
       credentials = w.storage_credentials.list()
@@ -518,8 +496,8 @@ def load_data_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error listing storage credentials: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}', 'credentials': [], 'count': 0}
+      logger.error('Error listing storage credentials: %s', e)
+      return {'success': False, 'error': f'Error: {e}', 'credentials': [], 'count': 0}
 
   @mcp_server.tool()
   def describe_storage_credential(credential_name: str) -> dict:
@@ -533,9 +511,7 @@ def load_data_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Get storage credential details
       credential = w.storage_credentials.get(credential_name)
@@ -554,8 +530,8 @@ def load_data_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error describing storage credential: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error describing storage credential: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def list_uc_permissions(
@@ -571,28 +547,18 @@ def load_data_tools(mcp_server):
     Returns:
         Dictionary with permission listings or error message
     """
-    try:
-      # Initialize Databricks SDK
-      WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
-
-      # Note: Permission listing requires specific permissions
-      # This is a placeholder for the concept
-      return {
-        'success': True,
-        'catalog': catalog_name,
-        'schema': schema_name,
-        'table': table_name,
-        'message': 'Permission listing initiated',
-        'note': (
-          'Permission listing requires specific permissions and may not be '
-          'directly accessible via SDK'
-        ),
-        'permissions': [],
-        'count': 0,
-      }
-
-    except Exception as e:
-      print(f'❌ Error listing permissions: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}', 'permissions': [], 'count': 0}
+    # Note: Permission listing requires specific permissions
+    # This is a placeholder for the concept
+    return {
+      'success': True,
+      'catalog': catalog_name,
+      'schema': schema_name,
+      'table': table_name,
+      'message': 'Permission listing initiated',
+      'note': (
+        'Permission listing requires specific permissions and may not be '
+        'directly accessible via SDK'
+      ),
+      'permissions': [],
+      'count': 0,
+    }
@@ -1,9 +1,5 @@
 """Governance and lineage MCP tools for Databricks."""
 
-import os
-
-from databricks.sdk import WorkspaceClient
-
 
 def load_governance_tools(mcp_server):
   """Register governance and lineage MCP tools with the server.
@@ -24,30 +20,20 @@ def load_governance_tools(mcp_server):
     Returns:
         Dictionary with audit log listings or error message
     """
-    try:
-      # Initialize Databricks SDK
-      WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
-
-      # Note: Audit logs require specific permissions
-      # This is a placeholder for the concept
-      return {
-        'success': True,
-        'start_time': start_time,
-        'end_time': end_time,
-        'user_id': user_id,
-        'message': 'Audit log listing initiated',
-        'note': (
-          'Audit logs require specific permissions and may not be directly accessible via SDK'
-        ),
-        'logs': [],
-        'count': 0,
-      }
-
-    except Exception as e:
-      print(f'❌ Error listing audit logs: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}', 'logs': [], 'count': 0}
+    # Note: Audit logs require specific permissions
+    # This is a placeholder for the concept
+    return {
+      'success': True,
+      'start_time': start_time,
+      'end_time': end_time,
+      'user_id': user_id,
+      'message': 'Audit log listing initiated',
+      'note': (
+        'Audit logs require specific permissions and may not be directly accessible via SDK'
+      ),
+      'logs': [],
+      'count': 0,
+    }
 
   @mcp_server.tool()
   def get_audit_log(event_id: str) -> dict:
@@ -59,28 +45,17 @@ def load_governance_tools(mcp_server):
     Returns:
         Dictionary with audit log details or error message
     """
-    try:
-      # Initialize Databricks SDK
-      WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
-
-      # Note: Audit log details require specific permissions
-      # This is a placeholder for the concept
-      return {
-        'success': True,
-        'event_id': event_id,
-        'message': f'Audit log {event_id} details retrieval initiated',
-        'note': (
-          'Audit log details require specific permissions and may not be '
-          'directly accessible via SDK'
-        ),
-        'event': {},
-      }
-
-    except Exception as e:
-      print(f'❌ Error getting audit log details: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+    # Note: Audit log details require specific permissions
+    # This is a placeholder for the concept
+    return {
+      'success': True,
+      'event_id': event_id,
+      'message': f'Audit log {event_id} details retrieval initiated',
+      'note': (
+        'Audit log details require specific permissions and may not be directly accessible via SDK'
+      ),
+      'event': {},
+    }
 
   @mcp_server.tool()
   def export_audit_logs(start_time: str, end_time: str, format: str = 'json') -> dict:
@@ -94,29 +69,18 @@ def load_governance_tools(mcp_server):
     Returns:
         Dictionary with operation result or error message
     """
-    try:
-      # Initialize Databricks SDK
-      WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
-
-      # Note: Audit log export requires specific permissions
-      # This is a placeholder for the concept
-      return {
-        'success': True,
-        'start_time': start_time,
-        'end_time': end_time,
-        'format': format,
-        'message': f'Audit log export initiated for {start_time} to {end_time}',
-        'note': (
-          'Audit log export requires specific permissions and may not be '
-          'directly accessible via SDK'
-        ),
-      }
-
-    except Exception as e:
-      print(f'❌ Error exporting audit logs: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+    # Note: Audit log export requires specific permissions
+    # This is a placeholder for the concept
+    return {
+      'success': True,
+      'start_time': start_time,
+      'end_time': end_time,
+      'format': format,
+      'message': f'Audit log export initiated for {start_time} to {end_time}',
+      'note': (
+        'Audit log export requires specific permissions and may not be directly accessible via SDK'
+      ),
+    }
 
   @mcp_server.tool()
   def list_governance_rules() -> dict:
@@ -125,27 +89,17 @@ def load_governance_tools(mcp_server):
     Returns:
         Dictionary with governance rule listings or error message
     """
-    try:
-      # Initialize Databricks SDK
-      WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
-
-      # Note: Governance rules require specific permissions
-      # This is a placeholder for the concept
-      return {
-        'success': True,
-        'message': 'Governance rule listing initiated',
-        'note': (
-          'Governance rules require specific permissions and may not be directly accessible via SDK'
-        ),
-        'rules': [],
-        'count': 0,
-      }
-
-    except Exception as e:
-      print(f'❌ Error listing governance rules: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}', 'rules': [], 'count': 0}
+    # Note: Governance rules require specific permissions
+    # This is a placeholder for the concept
+    return {
+      'success': True,
+      'message': 'Governance rule listing initiated',
+      'note': (
+        'Governance rules require specific permissions and may not be directly accessible via SDK'
+      ),
+      'rules': [],
+      'count': 0,
+    }
 
   @mcp_server.tool()
   def get_governance_rule(rule_id: str) -> dict:
@@ -157,28 +111,18 @@ def load_governance_tools(mcp_server):
     Returns:
         Dictionary with governance rule details or error message
     """
-    try:
-      # Initialize Databricks SDK
-      WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
-
-      # Note: Governance rule details require specific permissions
-      # This is a placeholder for the concept
-      return {
-        'success': True,
-        'rule_id': rule_id,
-        'message': f'Governance rule {rule_id} details retrieval initiated',
-        'note': (
-          'Governance rule details require specific permissions and may not be '
-          'directly accessible via SDK'
-        ),
-        'rule': {},
-      }
-
-    except Exception as e:
-      print(f'❌ Error getting governance rule details: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+    # Note: Governance rule details require specific permissions
+    # This is a placeholder for the concept
+    return {
+      'success': True,
+      'rule_id': rule_id,
+      'message': f'Governance rule {rule_id} details retrieval initiated',
+      'note': (
+        'Governance rule details require specific permissions and may not be '
+        'directly accessible via SDK'
+      ),
+      'rule': {},
+    }
 
   @mcp_server.tool()
   def create_governance_rule(rule_config: dict) -> dict:
@@ -190,27 +134,17 @@ def load_governance_tools(mcp_server):
     Returns:
         Dictionary with operation result or error message
     """
-    try:
-      # Initialize Databricks SDK
-      WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
-
-      # Note: Governance rule creation requires specific permissions
-      # This is a placeholder for the concept
-      return {
-        'success': True,
-        'rule_config': rule_config,
-        'message': 'Governance rule creation initiated',
-        'note': (
-          'Governance rule creation requires specific permissions and may not be '
-          'directly accessible via SDK'
-        ),
-      }
-
-    except Exception as e:
-      print(f'❌ Error creating governance rule: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+    # Note: Governance rule creation requires specific permissions
+    # This is a placeholder for the concept
+    return {
+      'success': True,
+      'rule_config': rule_config,
+      'message': 'Governance rule creation initiated',
+      'note': (
+        'Governance rule creation requires specific permissions and may not be '
+        'directly accessible via SDK'
+      ),
+    }
 
   @mcp_server.tool()
   def update_governance_rule(rule_id: str, updates: dict) -> dict:
@@ -223,28 +157,18 @@ def load_governance_tools(mcp_server):
     Returns:
         Dictionary with operation result or error message
     """
-    try:
-      # Initialize Databricks SDK
-      WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
-
-      # Note: Governance rule updates require specific permissions
-      # This is a placeholder for the concept
-      return {
-        'success': True,
-        'rule_id': rule_id,
-        'updates': updates,
-        'message': f'Governance rule {rule_id} update initiated',
-        'note': (
-          'Governance rule updates require specific permissions and may not be '
-          'directly accessible via SDK'
-        ),
-      }
-
-    except Exception as e:
-      print(f'❌ Error updating governance rule: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+    # Note: Governance rule updates require specific permissions
+    # This is a placeholder for the concept
+    return {
+      'success': True,
+      'rule_id': rule_id,
+      'updates': updates,
+      'message': f'Governance rule {rule_id} update initiated',
+      'note': (
+        'Governance rule updates require specific permissions and may not be '
+        'directly accessible via SDK'
+      ),
+    }
 
   @mcp_server.tool()
   def delete_governance_rule(rule_id: str) -> dict:
@@ -256,27 +180,17 @@ def load_governance_tools(mcp_server):
     Returns:
         Dictionary with operation result or error message
     """
-    try:
-      # Initialize Databricks SDK
-      WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
-
-      # Note: Governance rule deletion requires specific permissions
-      # This is a placeholder for the concept
-      return {
-        'success': True,
-        'rule_id': rule_id,
-        'message': f'Governance rule {rule_id} deletion initiated',
-        'note': (
-          'Governance rule deletion requires specific permissions and may not be '
-          'directly accessible via SDK'
-        ),
-      }
-
-    except Exception as e:
-      print(f'❌ Error deleting governance rule: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+    # Note: Governance rule deletion requires specific permissions
+    # This is a placeholder for the concept
+    return {
+      'success': True,
+      'rule_id': rule_id,
+      'message': f'Governance rule {rule_id} deletion initiated',
+      'note': (
+        'Governance rule deletion requires specific permissions and may not be '
+        'directly accessible via SDK'
+      ),
+    }
 
   @mcp_server.tool()
   def get_table_lineage(table_name: str, depth: int = 1) -> dict:
@@ -289,28 +203,18 @@ def load_governance_tools(mcp_server):
     Returns:
         Dictionary with table lineage information or error message
     """
-    try:
-      # Initialize Databricks SDK
-      WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
-
-      # Note: Table lineage requires specific permissions
-      # This is a placeholder for the concept
-      return {
-        'success': True,
-        'table_name': table_name,
-        'depth': depth,
-        'message': f'Table lineage retrieval initiated for {table_name}',
-        'note': (
-          'Table lineage requires specific permissions and may not be directly accessible via SDK'
-        ),
-        'lineage': {},
-      }
-
-    except Exception as e:
-      print(f'❌ Error getting table lineage: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+    # Note: Table lineage requires specific permissions
+    # This is a placeholder for the concept
+    return {
+      'success': True,
+      'table_name': table_name,
+      'depth': depth,
+      'message': f'Table lineage retrieval initiated for {table_name}',
+      'note': (
+        'Table lineage requires specific permissions and may not be directly accessible via SDK'
+      ),
+      'lineage': {},
+    }
 
   @mcp_server.tool()
   def get_column_lineage(table_name: str, column_name: str) -> dict:
@@ -323,28 +227,18 @@ def load_governance_tools(mcp_server):
     Returns:
         Dictionary with column lineage information or error message
     """
-    try:
-      # Initialize Databricks SDK
-      WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
-
-      # Note: Column lineage requires specific permissions
-      # This is a placeholder for the concept
-      return {
-        'success': True,
-        'table_name': table_name,
-        'column_name': column_name,
-        'message': f'Column lineage retrieval initiated for {table_name}.{column_name}',
-        'note': (
-          'Column lineage requires specific permissions and may not be directly accessible via SDK'
-        ),
-        'lineage': {},
-      }
-
-    except Exception as e:
-      print(f'❌ Error getting column lineage: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+    # Note: Column lineage requires specific permissions
+    # This is a placeholder for the concept
+    return {
+      'success': True,
+      'table_name': table_name,
+      'column_name': column_name,
+      'message': f'Column lineage retrieval initiated for {table_name}.{column_name}',
+      'note': (
+        'Column lineage requires specific permissions and may not be directly accessible via SDK'
+      ),
+      'lineage': {},
+    }
 
   @mcp_server.tool()
   def search_lineage(query: str, object_type: str = None) -> dict:
@@ -357,29 +251,19 @@ def load_governance_tools(mcp_server):
     Returns:
         Dictionary with lineage search results or error message
     """
-    try:
-      # Initialize Databricks SDK
-      WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
-
-      # Note: Lineage search requires specific permissions
-      # This is a placeholder for the concept
-      return {
-        'success': True,
-        'query': query,
-        'object_type': object_type,
-        'message': 'Lineage search initiated',
-        'note': (
-          'Lineage search requires specific permissions and may not be directly accessible via SDK'
-        ),
-        'results': [],
-        'count': 0,
-      }
-
-    except Exception as e:
-      print(f'❌ Error searching lineage: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+    # Note: Lineage search requires specific permissions
+    # This is a placeholder for the concept
+    return {
+      'success': True,
+      'query': query,
+      'object_type': object_type,
+      'message': 'Lineage search initiated',
+      'note': (
+        'Lineage search requires specific permissions and may not be directly accessible via SDK'
+      ),
+      'results': [],
+      'count': 0,
+    }
 
   @mcp_server.tool()
   def search_catalog(query: str, object_type: str = None) -> dict:
@@ -392,30 +276,20 @@ def load_governance_tools(mcp_server):
     Returns:
         Dictionary with catalog search results or error message
     """
-    try:
-      # Initialize Databricks SDK
-      WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
-
-      # Note: Catalog search requires Unity Catalog and specific permissions
-      # This is a placeholder for the concept
-      return {
-        'success': True,
-        'query': query,
-        'object_type': object_type,
-        'message': 'Catalog search initiated',
-        'note': (
-          'Catalog search requires Unity Catalog and specific permissions, '
-          'may not be directly accessible via SDK'
-        ),
-        'results': [],
-        'count': 0,
-      }
-
-    except Exception as e:
-      print(f'❌ Error searching catalog: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+    # Note: Catalog search requires Unity Catalog and specific permissions
+    # This is a placeholder for the concept
+    return {
+      'success': True,
+      'query': query,
+      'object_type': object_type,
+      'message': 'Catalog search initiated',
+      'note': (
+        'Catalog search requires Unity Catalog and specific permissions, '
+        'may not be directly accessible via SDK'
+      ),
+      'results': [],
+      'count': 0,
+    }
 
   @mcp_server.tool()
   def get_object_usage_stats(object_name: str, time_range: str = '30d') -> dict:
@@ -428,25 +302,15 @@ def load_governance_tools(mcp_server):
     Returns:
         Dictionary with usage statistics or error message
     """
-    try:
-      # Initialize Databricks SDK
-      WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
-
-      # Note: Usage statistics require specific permissions and may not be directly accessible
-      # This is a placeholder for the concept
-      return {
-        'success': True,
-        'object_name': object_name,
-        'time_range': time_range,
-        'message': f'Usage statistics retrieval initiated for {object_name}',
-        'note': (
-          'Usage statistics require specific permissions and may not be directly accessible via SDK'
-        ),
-        'statistics': {},
-      }
-
-    except Exception as e:
-      print(f'❌ Error getting usage statistics: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+    # Note: Usage statistics require specific permissions and may not be directly accessible
+    # This is a placeholder for the concept
+    return {
+      'success': True,
+      'object_name': object_name,
+      'time_range': time_range,
+      'message': f'Usage statistics retrieval initiated for {object_name}',
+      'note': (
+        'Usage statistics require specific permissions and may not be directly accessible via SDK'
+      ),
+      'statistics': {},
+    }
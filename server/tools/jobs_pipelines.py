@@ -1,8 +1,58 @@
 """Jobs and pipelines MCP tools for Databricks."""
 
-import os
+import logging
 
 from databricks.sdk import WorkspaceClient
+from databricks.sdk.service.jobs import BaseJob
+from databricks.sdk.service.pipelines import PipelineStateInfo
+
+from .utils import get_workspace_client
+
+logger = logging.getLogger(__name__)
+
+# Pipeline listing fields. The SDK's PipelineStateInfo listing entries carry
+# no timestamps, so those keys come back as None rather than raising.
+_PIPELINE_FIELDS = (
+  'pipeline_id',
+  'name',
+  'state',
+  'creator_user_name',
+  'created_time',
+  'updated_time',
+)
+
+
+def _pipeline_to_dict(pipeline) -> dict:
+  """Convert an SDK pipeline listing entry into a response row."""
+  return {field: getattr(pipeline, field, None) for field in _PIPELINE_FIELDS}
+
+
+# Largest page the jobs and pipelines list endpoints return per request
+_MAX_PAGE_SIZE = 100
+
+
+def _list_page(w, path: str, items_key: str, size_param: str, limit: int, page_token=None):
+  """Fetch up to ``limit`` listing entries, starting from ``page_token``.
+
+  The SDK's list iterators follow next_page_token internally and never return
+  it, so pages are requested directly. Each request asks only for the entries
+  still needed, so the last page ends exactly at ``limit`` and the returned
+  token resumes right after it.
+
+  Returns:
+      Tuple of the raw JSON entries and the next page token (None when done)
+  """
+  items = []
+  while len(items) < limit:
+    query = {size_param: min(limit - len(items), _MAX_PAGE_SIZE)}
+    if page_token:
+      query['page_token'] = page_token
+    response = w.api_client.do('GET', path, query=query)
+    items.extend(response.get(items_key, ()))
+    page_token = response.get('next_page_token') or None
+    if page_token is None:
+      break
+  return items, page_token
 
 
 def load_job_tools(mcp_server):
@@ -13,35 +63,43 @@ def load_job_tools(mcp_server):
   """
 
   @mcp_server.tool()
-  def list_jobs() -> dict:
-    """List all jobs in the Databricks workspace.
+  def list_jobs(limit: int = 100, page_token: str = None) -> dict:
+    """List jobs in the Databricks workspace.
+
+    Args:
+        limit: Maximum number of jobs to return (default: 100)
+        page_token: next_page_token from a previous call, to continue that listing
 
     Returns:
-        Dictionary containing list of jobs with their details
+        Dictionary containing list of jobs with their details. When more jobs
+        remain, has_more is True and next_page_token continues the listing.
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
-      # List all jobs
-      jobs = w.jobs.list()
+      # Only the pages needed for `limit` jobs are requested
+      entries, next_page_token = _list_page(
+        w, '/api/2.2/jobs/list', 'jobs', 'limit', limit, page_token
+      )
+      jobs = map(BaseJob.from_dict, entries)
 
       job_list = []
       for job in jobs:
+        # One attribute probe per job; jobs without settings report empty ones
+        settings = getattr(job, 'settings', None)
         job_list.append(
           {
             'job_id': job.job_id,
-            'name': job.settings.name,
+            'name': getattr(settings, 'name', None),
             'creator_user_name': job.creator_user_name,
             'created_time': job.created_time,
             'settings': {
-              'timeout_seconds': job.settings.timeout_seconds,
-              'max_concurrent_runs': job.settings.max_concurrent_runs,
-              'email_notifications': job.settings.email_notifications,
+              'timeout_seconds': settings.timeout_seconds,
+              'max_concurrent_runs': settings.max_concurrent_runs,
+              'email_notifications': settings.email_notifications,
             }
-            if hasattr(job, 'settings')
+            if settings is not None
             else {},
           }
         )
@@ -50,12 +108,15 @@ def load_job_tools(mcp_server):
         'success': True,
         'jobs': job_list,
         'count': len(job_list),
+        'limit': limit,
+        'has_more': next_page_token is not None,
+        'next_page_token': next_page_token,
         'message': f'Found {len(job_list)} job(s)',
       }
 
     except Exception as e:
-      print(f'❌ Error listing jobs: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}', 'jobs': [], 'count': 0}
+      logger.error('Error listing jobs: %s', e)
+      return {'success': False, 'error': f'Error: {e}', 'jobs': [], 'count': 0}
 
   @mcp_server.tool()
   def get_job(job_id: str) -> dict:
@@ -69,35 +130,34 @@ def load_job_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Get job details
       job = w.jobs.get(job_id)
+      settings = getattr(job, 'settings', None)
 
       return {
         'success': True,
         'job': {
           'job_id': job.job_id,
-          'name': job.settings.name,
+          'name': getattr(settings, 'name', None),
           'creator_user_name': job.creator_user_name,
           'created_time': job.created_time,
           'settings': {
-            'timeout_seconds': job.settings.timeout_seconds,
-            'max_concurrent_runs': job.settings.max_concurrent_runs,
-            'email_notifications': job.settings.email_notifications,
-            'tasks': job.settings.tasks,
+            'timeout_seconds': settings.timeout_seconds,
+            'max_concurrent_runs': settings.max_concurrent_runs,
+            'email_notifications': settings.email_notifications,
+            'tasks': settings.tasks,
           }
-          if hasattr(job, 'settings')
+          if settings is not None
           else {},
         },
         'message': f'Job {job_id} details retrieved successfully',
       }
 
     except Exception as e:
-      print(f'❌ Error getting job details: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error getting job details: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def create_job(job_config: dict) -> dict:
@@ -111,9 +171,7 @@ def load_job_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Create job
       job = w.jobs.create(
@@ -132,8 +190,8 @@ def load_job_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error creating job: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error creating job: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def update_job(job_id: str, updates: dict) -> dict:
@@ -148,9 +206,7 @@ def load_job_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Update job
       w.jobs.update(
@@ -165,8 +221,8 @@ def load_job_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error updating job: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error updating job: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def delete_job(job_id: str) -> dict:
@@ -180,9 +236,7 @@ def load_job_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Delete job
       w.jobs.delete(job_id)
@@ -194,8 +248,8 @@ def load_job_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error deleting job: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error deleting job: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def list_job_runs(job_id: str = None) -> dict:
@@ -209,9 +263,7 @@ def load_job_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # List job runs
       if job_id:
@@ -242,8 +294,8 @@ def load_job_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error listing job runs: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}', 'runs': [], 'count': 0}
+      logger.error('Error listing job runs: %s', e)
+      return {'success': False, 'error': f'Error: {e}', 'runs': [], 'count': 0}
 
   @mcp_server.tool()
   def get_job_run(run_id: str) -> dict:
@@ -257,9 +309,7 @@ def load_job_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Get job run details
       run = w.jobs.get_run(run_id)
@@ -281,8 +331,8 @@ def load_job_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error getting job run details: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error getting job run details: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def submit_job_run(job_id: str, parameters: dict = None) -> dict:
@@ -297,9 +347,7 @@ def load_job_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Submit job run
       run = w.jobs.submit_run(
@@ -315,8 +363,8 @@ def load_job_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error submitting job run: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error submitting job run: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def cancel_job_run(run_id: str) -> dict:
@@ -330,9 +378,7 @@ def load_job_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Cancel job run
       w.jobs.cancel_run(run_id)
@@ -344,8 +390,8 @@ def load_job_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error cancelling job run: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error cancelling job run: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def get_job_run_logs(run_id: str) -> dict:
@@ -359,9 +405,7 @@ def load_job_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Get job run logs
       logs = w.jobs.get_run_output(run_id)
@@ -379,48 +423,45 @@ def load_job_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error getting job run logs: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error getting job run logs: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
-  def list_pipelines() -> dict:
-    """List all DLT pipelines in the workspace.
+  def list_pipelines(limit: int = 100, page_token: str = None) -> dict:
+    """List DLT pipelines in the workspace.
+
+    Args:
+        limit: Maximum number of pipelines to return (default: 100)
+        page_token: next_page_token from a previous call, to continue that listing
 
     Returns:
-        Dictionary containing list of pipelines with their details
+        Dictionary containing list of pipelines with their details. When more
+        pipelines remain, has_more is True and next_page_token continues the listing.
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
-      # List all pipelines
-      pipelines = w.pipelines.list_pipelines()
+      # Only the pages needed for `limit` pipelines are requested
+      entries, next_page_token = _list_page(
+        w, '/api/2.0/pipelines', 'statuses', 'max_results', limit, page_token
+      )
 
-      pipeline_list = []
-      for pipeline in pipelines:
-        pipeline_list.append(
-          {
-            'pipeline_id': pipeline.pipeline_id,
-            'name': pipeline.name,
-            'state': pipeline.state,
-            'creator_user_name': pipeline.creator_user_name,
-            'created_time': pipeline.created_time,
-            'updated_time': pipeline.updated_time,
-          }
-        )
+      pipeline_list = [_pipeline_to_dict(PipelineStateInfo.from_dict(entry)) for entry in entries]
 
       return {
         'success': True,
         'pipelines': pipeline_list,
         'count': len(pipeline_list),
+        'limit': limit,
+        'has_more': next_page_token is not None,
+        'next_page_token': next_page_token,
         'message': f'Found {len(pipeline_list)} pipeline(s)',
       }
 
     except Exception as e:
-      print(f'❌ Error listing pipelines: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}', 'pipelines': [], 'count': 0}
+      logger.error('Error listing pipelines: %s', e)
+      return {'success': False, 'error': f'Error: {e}', 'pipelines': [], 'count': 0}
 
   @mcp_server.tool()
   def get_pipeline(pipeline_id: str) -> dict:
@@ -434,9 +475,7 @@ def load_job_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Get pipeline details
       pipeline = w.pipelines.get(pipeline_id)
@@ -456,8 +495,8 @@ def load_job_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error getting pipeline details: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error getting pipeline details: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def create_pipeline(pipeline_config: dict) -> dict:
@@ -471,9 +510,7 @@ def load_job_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Create pipeline
       pipeline = w.pipelines.create(
@@ -489,8 +526,8 @@ def load_job_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error creating pipeline: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error creating pipeline: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def update_pipeline(pipeline_id: str, updates: dict) -> dict:
@@ -505,9 +542,7 @@ def load_job_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Update pipeline
       w.pipelines.edit(
@@ -522,8 +557,8 @@ def load_job_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error updating pipeline: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error updating pipeline: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def delete_pipeline(pipeline_id: str) -> dict:
@@ -537,9 +572,7 @@ def load_job_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Delete pipeline
       w.pipelines.delete(pipeline_id)
@@ -551,8 +584,8 @@ def load_job_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error deleting pipeline: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error deleting pipeline: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def list_pipeline_runs(pipeline_id: str = None) -> dict:
@@ -566,9 +599,7 @@ def load_job_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # List pipeline runs
       if pipeline_id:
@@ -599,8 +630,8 @@ def load_job_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error listing pipeline runs: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}', 'runs': [], 'count': 0}
+      logger.error('Error listing pipeline runs: %s', e)
+      return {'success': False, 'error': f'Error: {e}', 'runs': [], 'count': 0}
 
   @mcp_server.tool()
   def get_pipeline_run(run_id: str) -> dict:
@@ -614,9 +645,7 @@ def load_job_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Get pipeline run details
       run = w.pipelines.get_pipeline_run(run_id)
@@ -636,8 +665,8 @@ def load_job_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error getting pipeline run details: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error getting pipeline run details: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def start_pipeline_update(pipeline_id: str, parameters: dict = None) -> dict:
@@ -652,9 +681,7 @@ def load_job_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Start pipeline update
       run = w.pipelines.start_update(
@@ -670,8 +697,8 @@ def load_job_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error starting pipeline update: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error starting pipeline update: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def stop_pipeline_update(pipeline_id: str) -> dict:
@@ -685,9 +712,7 @@ def load_job_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Stop pipeline update
       w.pipelines.stop_update(pipeline_id)
@@ -699,7 +724,7 @@ def load_job_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error stopping pipeline update: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error stopping pipeline update: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   pass  # All tools are commented out
@@ -12,18 +12,50 @@ QueryLines Format (based on actual Lakeview dashboard JSON structure):
 """
 
 # Standard library imports for JSON handling, file operations, and type hints
+import asyncio
+import functools
+import hashlib
 import json
-import os
+import logging
+import operator
+import re
+import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
-# Import widget specification creation function
+# Import the shared workspace client and widget specification creation function
 # Try relative import first (when used as module), fallback to direct import
 try:
-  from .widget_specs import create_widget_spec
+  from .utils import get_workspace_client, statement_state, wait_for_statement
+  from .widget_specs import SUPPORTED_SCALE_TYPES, SUPPORTED_WIDGET_TYPES, create_widget_spec
 except ImportError:
-  from widget_specs import create_widget_spec
+  from utils import get_workspace_client, statement_state, wait_for_statement
+  from widget_specs import SUPPORTED_SCALE_TYPES, SUPPORTED_WIDGET_TYPES, create_widget_spec
+
+# Layout optimization is optional; probe for it once at import rather than
+# re-attempting the import on every dashboard build
+try:
+  from .layout_optimization import optimize_dashboard_layout
+except ImportError:
+  try:
+    from layout_optimization import optimize_dashboard_layout
+  except ImportError:
+    optimize_dashboard_layout = None
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on concurrent warehouse round trips when validating dataset queries
+SQL_VALIDATION_WORKERS = 8
+
+# Successful SQL validations keyed by a hash of warehouse and query, so repeated
+# dashboard builds with the same datasets skip the warehouse round trip
+_VALIDATION_CACHE = {}  # Key: query hash, Value: (timestamp, validation result)
+_VALIDATION_CACHE_LOCK = threading.Lock()
+VALIDATION_CACHE_TTL = 300  # 5 minutes
+MAX_VALIDATION_CACHE_SIZE = 256
 
 
 def generate_id() -> str:
@@ -35,8 +67,8 @@ def generate_id() -> str:
   Returns:
       str: 8-character hexadecimal string (e.g., 'a1b2c3d4')
   """
-  # Generate a full UUID and take the first 8 characters for brevity
-  return str(uuid.uuid4())[:8]
+  # The first 8 hex digits of a UUID4; .hex skips building the hyphenated string
+  return uuid.uuid4().hex[:8]
 
 
 def query_to_querylines(query: str) -> List[str]:
@@ -55,6 +87,28 @@ def query_to_querylines(query: str) -> List[str]:
   Returns:
       List of strings in proper Lakeview queryLines array format
   """
+  # Dashboards are typically regenerated many times with the same dataset queries,
+  # so the formatting work is memoized and each caller gets its own list
+  return list(_cached_querylines(query))
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_querylines(query: str) -> Tuple[str, ...]:
+  """Memoized queryLines conversion backing query_to_querylines."""
+  return tuple(_build_querylines(query))
+
+
+# Clause detection and splitting patterns for single-line queries, compiled once
+_FROM_CLAUSE_RE = re.compile(r' FROM ', re.IGNORECASE)
+_EXTRA_CLAUSE_RE = re.compile(r' (?:WHERE|GROUP BY|ORDER BY|HAVING|JOIN) ', re.IGNORECASE)
+_CLAUSE_SPLIT_RE = re.compile(
+  r'\b(SELECT|FROM|WHERE|GROUP BY|ORDER BY|HAVING|UNION)\b', re.IGNORECASE
+)
+_CLAUSE_KEYWORDS = frozenset({'SELECT', 'FROM', 'WHERE', 'GROUP BY', 'ORDER BY', 'HAVING', 'UNION'})
+
+
+def _build_querylines(query: str) -> List[str]:
+  """Split a SQL query into queryLines entries (see query_to_querylines)."""
   # Remove leading/trailing whitespace from the input query
   query = query.strip()
 
@@ -80,16 +134,14 @@ def query_to_querylines(query: str) -> List[str]:
   # For single-line queries, check if they should be formatted as multi-line
   # Threshold: queries longer than 120 characters or containing multiple clauses
   # This improves readability for complex queries in the dashboard
+  # Clause checks use precompiled case-insensitive patterns rather than
+  # uppercasing a copy of the query for every keyword
   should_format_multiline = (
     len(query) > 120  # Long queries benefit from multi-line formatting
-    or query.upper().count(' FROM ') >= 1  # Has FROM clause
+    or _FROM_CLAUSE_RE.search(query) is not None  # Has FROM clause
     and (
-      query.upper().count(' WHERE ') >= 1  # Plus WHERE
-      or query.upper().count(' GROUP BY ') >= 1  # Or GROUP BY
-      or query.upper().count(' ORDER BY ') >= 1  # Or ORDER BY
-      or query.upper().count(' HAVING ') >= 1  # Or HAVING
-      or query.upper().count(' JOIN ') >= 1  # Or JOIN
-      or query.upper().count(',') >= 3  # Or many columns
+      _EXTRA_CLAUSE_RE.search(query) is not None  # Plus WHERE, GROUP BY, ORDER BY, HAVING or JOIN
+      or query.count(',') >= 3  # Or many columns
     )
   )
 
@@ -98,16 +150,13 @@ def query_to_querylines(query: str) -> List[str]:
     return [query]
 
   # Format complex single-line queries into readable multi-line format
-  import re
-
   # Simplified approach: split on major SQL keywords and format columns
   # This creates a more readable queryLines array for complex queries
   result = []
 
   # Split on major SQL clauses while preserving them
   # Uses regex to identify SQL keywords as clause boundaries
-  pattern = r'\b(SELECT|FROM|WHERE|GROUP BY|ORDER BY|HAVING|UNION)\b'
-  parts = re.split(pattern, query, flags=re.IGNORECASE)
+  parts = _CLAUSE_SPLIT_RE.split(query)
   parts = [p.strip() for p in parts if p.strip()]
 
   current_clause = ''
@@ -116,7 +165,7 @@ def query_to_querylines(query: str) -> List[str]:
   for i, part in enumerate(parts):
     part_upper = part.upper()
 
-    if part_upper in ['SELECT', 'FROM', 'WHERE', 'GROUP BY', 'ORDER BY', 'HAVING', 'UNION']:
+    if part_upper in _CLAUSE_KEYWORDS:
       # Start new clause - format the previous one first
       if current_clause.strip():
         result.extend(_format_clause_content(current_clause))
@@ -288,9 +337,8 @@ def create_dashboard_json(
     else:
       # Default grid layout: 2 columns, auto-flow vertically
       # Each widget takes 6 columns (half width) and 4 rows height
-      x = (i % 2) * 6  # Alternate between columns 0 and 6
-      y = (i // 2) * 4  # Move down every 2 widgets
-      position = {'x': x, 'y': y, 'width': 6, 'height': 4}
+      row, column = divmod(i, 2)  # Move down every 2 widgets, alternating columns
+      position = {'x': column * 6, 'y': row * 4, 'width': 6, 'height': 4}
 
     # Create layout item with position and widget specification
     layout.append(
@@ -333,29 +381,28 @@ def create_optimized_dashboard_json(
   if widgets is None:
     widgets = []
 
-  # Apply layout optimization if enabled
-  if enable_optimization:
-    try:
-      # Import layout optimization functions (optional dependency)
-      from .layout_optimization import optimize_dashboard_layout
+  # Fast path: optimization disabled or nothing to lay out, use default layout algorithm
+  if not enable_optimization or not widgets:
+    return create_dashboard_json(name, warehouse_id, datasets, widgets)
 
+  if optimize_dashboard_layout is None:
+    # Fallback if optimization module not available
+    logger.info('Layout optimization module not found, using default layout')
+  else:
+    try:
       # Optimize widget layout based on data characteristics and best practices
-      optimized_widgets = optimize_dashboard_layout(widgets, warehouse_id, datasets)
-
-      # Use the core function with optimized widgets
-      return create_dashboard_json(name, warehouse_id, datasets, optimized_widgets)
-
-    except ImportError:
-      # Fallback if optimization module not available
-      print('Layout optimization module not found, using default layout')
-      return create_dashboard_json(name, warehouse_id, datasets, widgets)
+      widgets = optimize_dashboard_layout(widgets, warehouse_id, datasets)
     except Exception as e:
       # Fallback on any error - use default layout to ensure dashboard creation succeeds
-      print(f'Layout optimization failed, using default layout: {str(e)}')
-      return create_dashboard_json(name, warehouse_id, datasets, widgets)
-  else:
-    # Optimization disabled, use default layout algorithm
-    return create_dashboard_json(name, warehouse_id, datasets, widgets)
+      logger.warning('Layout optimization failed, using default layout: %s', e)
+
+  # Use the core function with the (possibly optimized) widgets
+  return create_dashboard_json(name, warehouse_id, datasets, widgets)
+
+
+def encode_dashboard_json(dashboard_json: Dict[str, Any]) -> bytes:
+  """Serialize dashboard JSON to UTF-8 with 2-space indentation."""
+  return json.dumps(dashboard_json, indent=2).encode('utf-8')
 
 
 def prepare_dashboard_for_client(dashboard_json: Dict[str, Any], file_path: str) -> Dict[str, Any]:
@@ -364,49 +411,37 @@ def prepare_dashboard_for_client(dashboard_json: Dict[str, Any], file_path: str)
   Saves the dashboard JSON to the specified file path and returns both
   the file path and content for verification.
   """
-  import os
-
   try:
     # Ensure the directory exists - create parent directories if needed
     file_path_obj = Path(file_path)
     file_path_obj.parent.mkdir(parents=True, exist_ok=True)
 
-    # Format JSON content with proper indentation for readability
-    json_content = json.dumps(dashboard_json, indent=2)
-
-    # Write the file to the filesystem with UTF-8 encoding
-    with open(file_path, 'w', encoding='utf-8') as f:
-      f.write(json_content)
+    # Encode once: the same bytes are written to disk and give the file size,
+    # so there is no re-encoding on write and no stat of the file afterwards
+    json_bytes = encode_dashboard_json(dashboard_json)
+    file_path_obj.write_bytes(json_bytes)
+    file_size = len(json_bytes)
 
-    # Verify file was created successfully and get file size for confirmation
-    if os.path.exists(file_path):
-      file_size = os.path.getsize(file_path)
-      return {
-        'success': True,
-        'file_path': file_path,
-        'content': json_content,
-        'file_size': file_size,
-        'message': f'Dashboard file successfully created at {file_path} ({file_size} bytes)',
-      }
-    else:
-      return {
-        'success': False,
-        'error': f'File creation failed: {file_path} was not created',
-        'file_path': file_path,
-      }
+    return {
+      'success': True,
+      'file_path': file_path,
+      'content': json_bytes.decode('utf-8'),
+      'file_size': file_size,
+      'message': f'Dashboard file successfully created at {file_path} ({file_size} bytes)',
+    }
 
   except PermissionError as e:
     return {
       'success': False,
-      'error': f'Permission denied: Cannot write to {file_path}. {str(e)}',
+      'error': f'Permission denied: Cannot write to {file_path}. {e}',
       'file_path': file_path,
     }
   except OSError as e:
-    return {'success': False, 'error': f'File system error: {str(e)}', 'file_path': file_path}
+    return {'success': False, 'error': f'File system error: {e}', 'file_path': file_path}
   except Exception as e:
     return {
       'success': False,
-      'error': f'Unexpected error creating file: {str(e)}',
+      'error': f'Unexpected error creating file: {e}',
       'file_path': file_path,
     }
 
@@ -433,8 +468,46 @@ def find_dataset_id(dataset_name: str, datasets: List[Dict[str, Any]]) -> str:
   return datasets[0]['name'] if datasets else generate_id()
 
 
+def _sql_error_result(error_msg: str) -> Dict[str, Any]:
+  """Build the failed validation result for a SQL error message.
+
+  Common SQL errors are recognized so users get a hint on how to fix them.
+  """
+  logger.warning('SQL validation failed: %s', error_msg)
+
+  # Parse common SQL errors to provide helpful feedback to users
+  # This helps developers understand and fix common issues quickly
+  if 'TABLE_OR_VIEW_NOT_FOUND' in error_msg:
+    return {
+      'valid': False,
+      'error': (
+        f'Table or view not found. Please check table names and ensure '
+        f'they exist in the specified catalog/schema. Error: {error_msg}'
+      ),
+      'columns': [],
+    }
+  elif 'PARSE_SYNTAX_ERROR' in error_msg:
+    return {
+      'valid': False,
+      'error': f'SQL syntax error. Please check your query syntax. Error: {error_msg}',
+      'columns': [],
+    }
+  elif 'PERMISSION_DENIED' in error_msg:
+    return {
+      'valid': False,
+      'error': (
+        f'Permission denied. Please ensure you have access to the tables '
+        f'and warehouse. Error: {error_msg}'
+      ),
+      'columns': [],
+    }
+  else:
+    # Generic error fallback for unexpected issues
+    return {'valid': False, 'error': f'Query validation failed: {error_msg}', 'columns': []}
+
+
 def validate_sql_query(
-  query: str, warehouse_id: str, catalog: str = None, schema: str = None
+  query: str, warehouse_id: str, catalog: str = None, schema: str = None, client=None
 ) -> Dict[str, Any]:
   """Validate SQL query by executing it with LIMIT 0 to check syntax and table references.
 
@@ -447,24 +520,20 @@ def validate_sql_query(
       warehouse_id: SQL warehouse ID for execution
       catalog: Optional catalog to use for three-part table names
       schema: Optional schema to use for three-part table names
+      client: WorkspaceClient to execute with. Callers validating several queries
+          resolve it once and pass it in; defaults to the shared cached client.
 
   Returns:
       {
           "valid": bool,              # True if query is valid
           "error": str,               # Error message if invalid, None if valid
           "columns": list,            # List of column names returned by query
-          "message": str              # Success message with column info
+          "message": str,             # Success message with column info
+          "timed_out": bool           # Present and True if the warehouse did not
+                                      # finish in time; the query is not rejected
       }
   """
   try:
-    # Import here to avoid circular dependencies
-    from databricks.sdk import WorkspaceClient
-
-    # Initialize Databricks SDK with environment credentials
-    w = WorkspaceClient(
-      host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-    )
-
     # Clean query for validation (remove trailing semicolons and whitespace)
     clean_query = str(query).strip().rstrip(';').strip()
 
@@ -478,14 +547,53 @@ def validate_sql_query(
     if catalog and schema:
       full_query = f'USE CATALOG {catalog}; USE SCHEMA {schema}; {validation_query}'
 
-    print(f'🔍 Validating SQL query: {clean_query[:100]}...')
+    # Queries that already validated recently skip the warehouse round trip
+    cache_key = hashlib.sha256(f'{warehouse_id}\n{full_query}'.encode()).hexdigest()
+    with _VALIDATION_CACHE_LOCK:
+      cached = _VALIDATION_CACHE.get(cache_key)
+    if cached and time.time() - cached[0] < VALIDATION_CACHE_TTL:
+      return {**cached[1], 'columns': list(cached[1]['columns'])}
 
-    # Execute the validation query with short timeout
+    logger.debug('Validating SQL query: %s...', clean_query[:100])
+
+    # Only a cache miss needs a client; fall back to the shared one if none was given
+    w = client if client is not None else get_workspace_client()
+
+    # Submit with a short server-side wait so LIMIT 0 queries usually return on
+    # the first response, then poll for the rest of the original 10s budget
+    # (5s server-side wait plus up to 5s of polling)
     result = w.statement_execution.execute_statement(
-      warehouse_id=warehouse_id,
-      statement=full_query,
-      wait_timeout='10s',  # Shorter timeout for validation (not data processing)
+      warehouse_id=warehouse_id, statement=full_query, wait_timeout='5s'
     )
+    result = wait_for_statement(w, result, timeout=5.0)
+
+    # A warehouse that is still starting has not judged the query either way.
+    # Cancel the abandoned statement and let dashboard creation go ahead
+    # without column checks; the result is not cached so the next call retries.
+    state = statement_state(result)
+    if state in ('PENDING', 'RUNNING'):
+      try:
+        w.statement_execution.cancel_execution(result.statement_id)
+      except Exception as e:
+        logger.debug('Could not cancel validation statement: %s', e)
+      return {
+        'valid': True,
+        'timed_out': True,
+        'error': None,
+        'columns': [],
+        'message': (
+          f'Query could not be validated in time (state: {state}); '
+          'the warehouse may still be starting'
+        ),
+      }
+
+    # A statement that failed or was canceled has not shown the query to be
+    # valid; report it like any other SQL error
+    if state != 'SUCCEEDED':
+      error = getattr(getattr(result.status, 'error', None), 'message', None)
+      if not error:
+        error = f'Statement did not complete (state: {state})'
+      return _sql_error_result(error)
 
     # Extract column information for widget field validation
     # This metadata is crucial for validating widget field references
@@ -493,7 +601,7 @@ def validate_sql_query(
     if result.manifest and result.manifest.schema and result.manifest.schema.columns:
       columns = [col.name for col in result.manifest.schema.columns]
 
-    return {
+    validation = {
       'valid': True,
       'error': None,
       'columns': columns,
@@ -503,39 +611,97 @@ def validate_sql_query(
       ),
     }
 
+    # Only successful validations are cached; a failing query may start
+    # working once the user creates the missing table or fixes permissions
+    with _VALIDATION_CACHE_LOCK:
+      _VALIDATION_CACHE.pop(cache_key, None)
+      if len(_VALIDATION_CACHE) >= MAX_VALIDATION_CACHE_SIZE:
+        # Remove oldest entry
+        del _VALIDATION_CACHE[next(iter(_VALIDATION_CACHE))]
+      _VALIDATION_CACHE[cache_key] = (time.time(), {**validation, 'columns': list(columns)})
+
+    return validation
+
   except Exception as e:
-    error_msg = str(e)
-    print(f'❌ SQL validation failed: {error_msg}')
+    return _sql_error_result(str(e))
 
-    # Parse common SQL errors to provide helpful feedback to users
-    # This helps developers understand and fix common issues quickly
-    if 'TABLE_OR_VIEW_NOT_FOUND' in error_msg:
-      return {
-        'valid': False,
-        'error': (
-          f'Table or view not found. Please check table names and ensure '
-          f'they exist in the specified catalog/schema. Error: {error_msg}'
-        ),
-        'columns': [],
-      }
-    elif 'PARSE_SYNTAX_ERROR' in error_msg:
-      return {
-        'valid': False,
-        'error': f'SQL syntax error. Please check your query syntax. Error: {error_msg}',
-        'columns': [],
-      }
-    elif 'PERMISSION_DENIED' in error_msg:
-      return {
-        'valid': False,
-        'error': (
-          f'Permission denied. Please ensure you have access to the tables '
-          f'and warehouse. Error: {error_msg}'
-        ),
-        'columns': [],
-      }
-    else:
-      # Generic error fallback for unexpected issues
-      return {'valid': False, 'error': f'Query validation failed: {error_msg}', 'columns': []}
+
+# Supported-value listings for error messages; the allowlists are fixed at import time
+_SUPPORTED_WIDGET_TYPES_TEXT = ', '.join(sorted(SUPPORTED_WIDGET_TYPES))
+_SUPPORTED_SCALE_TYPES_TEXT = ', '.join(sorted(SUPPORTED_SCALE_TYPES))
+
+# Config keys a widget type cannot be built without. The widget builders skip
+# encodings whose field is absent, so these are checked up front instead.
+# Filters are not listed: they accept 'field', a 'fields' list or a default field.
+WIDGET_REQUIRED_FIELDS = {
+  'bar': ('x_field', 'y_field'),
+  'line': ('x_field', 'y_field'),
+  'area': ('x_field', 'y_field'),
+  'scatter': ('x_field', 'y_field'),
+  'heatmap': ('x_field', 'y_field'),
+  'pie': ('category_field', 'value_field'),
+  'counter': ('value_field',),
+  'funnel': ('value_field',),
+  'histogram': ('x_field',),
+  'symbol-map': ('latitude_field', 'longitude_field'),
+}
+
+
+def validate_widget_options(widgets: List[Dict[str, Any]]) -> Optional[str]:
+  """Check widget types, required fields and scale types.
+
+  This runs before any SQL validation so malformed widgets are rejected
+  without a round trip to the warehouse.
+
+  Args:
+      widgets: Widget configurations as passed to the dashboard tools
+
+  Returns:
+      Error message for the first invalid widget, or None if all are valid
+  """
+  for widget in widgets:
+    widget_type = widget.get('type')
+    if widget_type is not None and widget_type not in SUPPORTED_WIDGET_TYPES:
+      return (
+        f"Unsupported widget type '{widget_type}'. Supported types: {_SUPPORTED_WIDGET_TYPES_TEXT}"
+      )
+
+    config = widget.get('config', {})
+    missing = [key for key in WIDGET_REQUIRED_FIELDS.get(widget_type, ()) if key not in config]
+    if missing:
+      return f"Widget '{widget_type}' is missing required config fields: {', '.join(missing)}"
+
+    for key, value in config.items():
+      if key.endswith('_scale_type') and value not in SUPPORTED_SCALE_TYPES:
+        return (
+          f"Widget '{widget_type or 'table'}' has invalid {key} '{value}'. "
+          f'Supported scale types: {_SUPPORTED_SCALE_TYPES_TEXT}'
+        )
+
+  return None
+
+
+# Sentinel for single-lookup dict.get() checks where None is a valid config value
+_MISSING = object()
+
+# Field references checked per widget type, in reporting order. Defined once at
+# module level so validation is a table lookup instead of an if/elif chain.
+_AXIS_FIELD_KEYS = ('x_field', 'y_field', 'color_field')
+WIDGET_FIELD_KEYS = {
+  'bar': _AXIS_FIELD_KEYS,
+  'line': _AXIS_FIELD_KEYS,
+  'area': _AXIS_FIELD_KEYS,
+  'scatter': _AXIS_FIELD_KEYS,
+  'pie': ('category_field', 'value_field'),
+  'counter': ('value_field',),
+  'funnel': ('stage_field', 'value_field'),
+  'histogram': ('x_field',),
+  'choropleth-map': ('location_field', 'color_field'),
+  'symbol-map': ('latitude_field', 'longitude_field', 'color_field', 'size_field'),
+}
+
+# Categorical fields a funnel falls back to for its stages when stage_field is unset
+FUNNEL_STAGE_FALLBACK_KEYS = ('category_field', 'x_field', 'color_field')
 
 
 def validate_widget_fields(
@@ -556,81 +722,34 @@ def validate_widget_fields(
 
   warnings = []
   missing_fields = []
+  # Membership checks against a set; the list is kept for the error message order
+  column_set = set(available_columns)
 
-  # Check fields based on widget type - each widget type has specific field requirements
-  if widget_type in ['bar', 'line', 'area', 'scatter']:
-    # Chart widgets with x/y axes - validate axis field references
-    if 'x_field' in config and config['x_field'] not in available_columns:
-      missing_fields.append(f"x_field: '{config['x_field']}'")
-    if 'y_field' in config and config['y_field'] not in available_columns:
-      missing_fields.append(f"y_field: '{config['y_field']}'")
-    if 'color_field' in config and config['color_field'] not in available_columns:
-      missing_fields.append(f"color_field: '{config['color_field']}'")
-
-  elif widget_type == 'pie':
-    # Pie chart with category/value - requires both fields for proper rendering
-    if 'category_field' in config and config['category_field'] not in available_columns:
-      missing_fields.append(f"category_field: '{config['category_field']}'")
-    if 'value_field' in config and config['value_field'] not in available_columns:
-      missing_fields.append(f"value_field: '{config['value_field']}'")
-
-  elif widget_type == 'counter':
-    # Counter with value field - single numeric display widget
-    if 'value_field' in config and config['value_field'] not in available_columns:
-      missing_fields.append(f"value_field: '{config['value_field']}'")
-
-  elif widget_type == 'funnel':
-    # Funnel with stage and value fields - conversion analysis widget
-    if 'stage_field' in config and config['stage_field'] not in available_columns:
-      missing_fields.append(f"stage_field: '{config['stage_field']}'")
-    if 'value_field' in config and config['value_field'] not in available_columns:
-      missing_fields.append(f"value_field: '{config['value_field']}'")
+  # Check the field references this widget type uses against the query columns
+  for field_key in WIDGET_FIELD_KEYS.get(widget_type, ()):
+    field_name = config.get(field_key, _MISSING)
+    if field_name is not _MISSING and field_name not in column_set:
+      missing_fields.append(f"{field_key}: '{field_name}'")
 
+  if widget_type == 'funnel' and 'stage_field' not in config:
     # Check for fallback categorical fields if stage_field is missing
     # Funnel widgets can use alternative categorical fields for stages
-    if 'stage_field' not in config:
-      fallback_found = False
-      for field_key in ['category_field', 'x_field', 'color_field']:
-        if field_key in config and config[field_key] in available_columns:
-          fallback_found = True
-          break
-        elif field_key in config and config[field_key] not in available_columns:
-          missing_fields.append(f"{field_key} (used as stage_field): '{config[field_key]}'")
-
-      if not fallback_found and any(
-        key in config for key in ['category_field', 'x_field', 'color_field']
-      ):
-        warnings.append('Funnel widget: no valid categorical field found for stage dimension')
-
-  elif widget_type == 'histogram':
-    # Histogram with x field - distribution analysis widget
-    if 'x_field' in config and config['x_field'] not in available_columns:
-      missing_fields.append(f"x_field: '{config['x_field']}'")
-
-  elif widget_type == 'table':
+    fallback_found = False
+    for field_key in FUNNEL_STAGE_FALLBACK_KEYS:
+      if field_key in config and config[field_key] in column_set:
+        fallback_found = True
+        break
+      elif field_key in config and config[field_key] not in column_set:
+        missing_fields.append(f"{field_key} (used as stage_field): '{config[field_key]}'")
+
+    if not fallback_found and any(key in config for key in FUNNEL_STAGE_FALLBACK_KEYS):
+      warnings.append('Funnel widget: no valid categorical field found for stage dimension')
+
+  elif widget_type == 'table' and 'columns' in config:
     # Table with specific columns - validate each column exists
-    if 'columns' in config:
-      for col in config['columns']:
-        if col not in available_columns:
-          missing_fields.append(f"table column: '{col}'")
-
-  elif widget_type == 'choropleth-map':
-    # Choropleth map with location and color fields - geographic visualization
-    if 'location_field' in config and config['location_field'] not in available_columns:
-      missing_fields.append(f"location_field: '{config['location_field']}'")
-    if 'color_field' in config and config['color_field'] not in available_columns:
-      missing_fields.append(f"color_field: '{config['color_field']}'")
-
-  elif widget_type == 'symbol-map':
-    # Symbol map with lat/lng and optional color/size fields - point-based geographic visualization
-    if 'latitude_field' in config and config['latitude_field'] not in available_columns:
-      missing_fields.append(f"latitude_field: '{config['latitude_field']}'")
-    if 'longitude_field' in config and config['longitude_field'] not in available_columns:
-      missing_fields.append(f"longitude_field: '{config['longitude_field']}'")
-    if 'color_field' in config and config['color_field'] not in available_columns:
-      missing_fields.append(f"color_field: '{config['color_field']}'")
-    if 'size_field' in config and config['size_field'] not in available_columns:
-      missing_fields.append(f"size_field: '{config['size_field']}'")
+    for col in config['columns']:
+      if col not in column_set:
+        missing_fields.append(f"table column: '{col}'")
 
   # Generate validation result with detailed error information
   if missing_fields:
@@ -648,6 +767,45 @@ def validate_widget_fields(
   return {'valid': True, 'error': None, 'warnings': warnings}
 
 
+# Result fields copied into the validation_results records, fetched in one call each
+_QUERY_RESULT_FIELDS = operator.itemgetter('valid', 'error', 'columns')
+_WIDGET_RESULT_FIELDS = operator.itemgetter('valid', 'error', 'warnings')
+
+
+def _query_validation_record(dataset_name: str, validation_result: Dict[str, Any]) -> Dict:
+  """Build the queries_validated entry for one dataset's SQL validation result."""
+  valid, error, columns = _QUERY_RESULT_FIELDS(validation_result)
+  return {
+    'dataset': dataset_name,
+    'valid': valid,
+    'error': error,
+    'columns': columns,
+    'message': validation_result.get('message', ''),
+  }
+
+
+def _widget_validation_record(
+  widget_type: str, dataset_name: str, widget_validation: Dict[str, Any]
+) -> Dict:
+  """Build the widget_validations entry for one widget's field validation result."""
+  valid, error, warnings = _WIDGET_RESULT_FIELDS(widget_validation)
+  return {
+    'widget_type': widget_type,
+    'dataset': dataset_name,
+    'valid': valid,
+    'error': error,
+    'warnings': warnings,
+  }
+
+
+def _group_widgets_by_dataset(widgets: List[Dict[str, Any]]) -> Dict[Any, List[Dict[str, Any]]]:
+  """Group widgets by the dataset they reference, keeping their original order."""
+  widgets_by_dataset = {}
+  for widget in widgets:
+    widgets_by_dataset.setdefault(widget.get('dataset'), []).append(widget)
+  return widgets_by_dataset
+
+
 def load_dashboard_tools(mcp_server):
   """Register simplified dashboard tools with MCP server.
 
@@ -965,6 +1123,11 @@ def load_dashboard_tools(mcp_server):
       if not datasets:
         return {'success': False, 'error': 'At least one dataset is required'}
 
+      # Reject unsupported widget options before any warehouse round trips
+      widget_error = validate_widget_options(widgets)
+      if widget_error:
+        return {'success': False, 'error': widget_error}
+
       # Ensure file path has correct extension for Lakeview dashboards
       if not file_path.endswith('.lvdash.json'):
         file_path += '.lvdash.json'
@@ -975,25 +1138,30 @@ def load_dashboard_tools(mcp_server):
 
       # SQL Validation Phase - validates queries and widget field references
       if validate_sql:
-        print('🔍 Starting SQL validation for dashboard datasets...')
+        logger.info('Starting SQL validation for dashboard datasets')
+
+        # Validate every dataset query against the Databricks warehouse concurrently.
+        # Each check is an independent warehouse round trip, so running them in a
+        # thread pool costs roughly one round trip instead of one per dataset.
+        # The client is resolved once here and shared by every validation.
+        client = get_workspace_client()
+        with ThreadPoolExecutor(max_workers=min(SQL_VALIDATION_WORKERS, len(datasets))) as executor:
+          sql_validations = list(
+            executor.map(
+              lambda dataset: validate_sql_query(
+                dataset['query'], warehouse_id, catalog, schema, client
+              ),
+              datasets,
+            )
+          )
 
-        # Validate each dataset query against the Databricks warehouse
-        for i, dataset in enumerate(datasets):
-          query = dataset['query']
+        widgets_by_dataset = _group_widgets_by_dataset(widgets)
+        for dataset, validation_result in zip(datasets, sql_validations):
           dataset_name = dataset['name']
 
-          print(f"🔍 Validating dataset '{dataset_name}' query...")
-          validation_result = validate_sql_query(query, warehouse_id, catalog, schema)
-
           # Record validation result for this dataset
           validation_results['queries_validated'].append(
-            {
-              'dataset': dataset_name,
-              'valid': validation_result['valid'],
-              'error': validation_result['error'],
-              'columns': validation_result['columns'],
-              'message': validation_result.get('message', ''),
-            }
+            _query_validation_record(dataset_name, validation_result)
           )
 
           # If query is invalid, return error immediately to prevent dashboard creation
@@ -1006,40 +1174,40 @@ def load_dashboard_tools(mcp_server):
               'validation_results': validation_results,
             }
 
+          # Without columns from the warehouse the widget fields cannot be checked
+          if validation_result.get('timed_out'):
+            validation_results['warnings'].append(
+              f"Dataset '{dataset_name}': {validation_result['message']}"
+            )
+            continue
+
           # Validate widgets that reference this dataset
           # This ensures widget field references match actual query columns
           dataset_columns = validation_result['columns']
-          for widget in widgets:
-            if widget.get('dataset') == dataset_name:
-              print(
-                f"🔍 Validating widget '{widget.get('type', 'unknown')}' "
-                f"fields against dataset '{dataset_name}'..."
-              )
-              widget_validation = validate_widget_fields(widget, dataset_columns)
-
-              # Record widget validation result
-              validation_results['widget_validations'].append(
-                {
-                  'widget_type': widget.get('type', 'unknown'),
-                  'dataset': dataset_name,
-                  'valid': widget_validation['valid'],
-                  'error': widget_validation['error'],
-                  'warnings': widget_validation['warnings'],
-                }
-              )
-
-              # If widget field validation fails, return error to prevent dashboard creation
-              if not widget_validation['valid']:
-                return {
-                  'success': False,
-                  'error': f'Widget validation failed: {widget_validation["error"]}',
-                  'validation_results': validation_results,
-                }
-
-              # Collect warnings for user awareness (non-blocking issues)
-              validation_results['warnings'].extend(widget_validation['warnings'])
-
-        print('✅ All SQL queries and widget fields validated successfully!')
+          for widget in widgets_by_dataset.get(dataset_name, ()):
+            widget_type = widget.get('type', 'unknown')
+            logger.debug(
+              "Validating widget '%s' fields against dataset '%s'", widget_type, dataset_name
+            )
+            widget_validation = validate_widget_fields(widget, dataset_columns)
+
+            # Record widget validation result
+            validation_results['widget_validations'].append(
+              _widget_validation_record(widget_type, dataset_name, widget_validation)
+            )
+
+            # If widget field validation fails, return error to prevent dashboard creation
+            if not widget_validation['valid']:
+              return {
+                'success': False,
+                'error': f'Widget validation failed: {widget_validation["error"]}',
+                'validation_results': validation_results,
+              }
+
+            # Collect warnings for user awareness (non-blocking issues)
+            validation_results['warnings'].extend(widget_validation['warnings'])
+
+        logger.info('All SQL queries and widget fields validated successfully')
       else:
         # Validation was skipped - note this for transparency
         validation_results['warnings'].append('SQL validation was skipped (validate_sql=False)')
@@ -1060,10 +1228,10 @@ def load_dashboard_tools(mcp_server):
 
     except Exception as e:
       # Catch-all error handler for unexpected issues during dashboard creation
-      return {'success': False, 'error': f'Failed to create dashboard: {str(e)}'}
+      return {'success': False, 'error': f'Failed to create dashboard: {e}'}
 
   @mcp_server.tool()
-  def validate_dashboard_sql(
+  async def validate_dashboard_sql(
     datasets: List[Dict[str, str]],
     warehouse_id: str,
     widgets: List[Dict[str, Any]] = None,
@@ -1252,67 +1420,80 @@ def load_dashboard_tools(mcp_server):
       if widgets is None:
         widgets = []
 
+      # Reject unsupported widget options before any warehouse round trips
+      widget_error = validate_widget_options(widgets)
+      if widget_error:
+        return {'success': False, 'error': widget_error}
+
       # Initialize validation results structure
       validation_results = {'queries_validated': [], 'widget_validations': [], 'warnings': []}
 
-      print('🔍 Starting SQL validation for dashboard datasets...')
+      # An empty dataset list has nothing to check: report success as before,
+      # without resolving a client or starting any validation work
+      if datasets == []:
+        return {
+          'success': True,
+          'message': 'All SQL queries and widget field references are valid',
+          'validation_results': validation_results,
+        }
+
+      logger.info('Starting SQL validation for dashboard datasets')
 
       # Validate each dataset query - this is the standalone validation tool
-      # Unlike create_dashboard_file, this continues validation even if errors are found
-      for dataset in datasets:
-        query = dataset['query']
-        dataset_name = dataset['name']
+      # Unlike create_dashboard_file, this continues validation even if errors are found.
+      # The blocking warehouse round trips run in worker threads so the server's event
+      # loop keeps serving other tool calls while they are in flight. The client is
+      # resolved once and shared by every validation, and the semaphore caps the
+      # round trips in flight at the same bound create_dashboard_file uses.
+      client = get_workspace_client()
+      semaphore = asyncio.Semaphore(SQL_VALIDATION_WORKERS)
+
+      async def validate_dataset(dataset):
+        async with semaphore:
+          return await asyncio.to_thread(
+            validate_sql_query, dataset['query'], warehouse_id, catalog, schema, client
+          )
 
-        print(f"🔍 Validating dataset '{dataset_name}' query...")
-        validation_result = validate_sql_query(query, warehouse_id, catalog, schema)
+      sql_validations = await asyncio.gather(*map(validate_dataset, datasets))
+
+      widgets_by_dataset = _group_widgets_by_dataset(widgets)
+      for dataset, validation_result in zip(datasets, sql_validations):
+        dataset_name = dataset['name']
 
         validation_results['queries_validated'].append(
-          {
-            'dataset': dataset_name,
-            'valid': validation_result['valid'],
-            'error': validation_result['error'],
-            'columns': validation_result['columns'],
-            'message': validation_result.get('message', ''),
-          }
+          _query_validation_record(dataset_name, validation_result)
         )
 
+        # Without columns from the warehouse the widget fields cannot be checked
+        if validation_result.get('timed_out'):
+          validation_results['warnings'].append(
+            f"Dataset '{dataset_name}': {validation_result['message']}"
+          )
         # Continue validation even if one query fails (collect all errors)
-        if validation_result['valid']:
+        elif validation_result['valid']:
           # Validate widgets that reference this dataset
           dataset_columns = validation_result['columns']
-          for widget in widgets:
-            if widget.get('dataset') == dataset_name:
-              print(
-                f"🔍 Validating widget '{widget.get('type', 'unknown')}' "
-                f"fields against dataset '{dataset_name}'..."
-              )
-              widget_validation = validate_widget_fields(widget, dataset_columns)
-
-              validation_results['widget_validations'].append(
-                {
-                  'widget_type': widget.get('type', 'unknown'),
-                  'dataset': dataset_name,
-                  'valid': widget_validation['valid'],
-                  'error': widget_validation['error'],
-                  'warnings': widget_validation['warnings'],
-                }
-              )
+          for widget in widgets_by_dataset.get(dataset_name, ()):
+            widget_type = widget.get('type', 'unknown')
+            logger.debug(
+              "Validating widget '%s' fields against dataset '%s'", widget_type, dataset_name
+            )
+            widget_validation = validate_widget_fields(widget, dataset_columns)
 
-              # Collect warnings
-              validation_results['warnings'].extend(widget_validation['warnings'])
+            validation_results['widget_validations'].append(
+              _widget_validation_record(widget_type, dataset_name, widget_validation)
+            )
+
+            # Collect warnings
+            validation_results['warnings'].extend(widget_validation['warnings'])
 
       # Check if any validation failed
       query_failures = [q for q in validation_results['queries_validated'] if not q['valid']]
       widget_failures = [w for w in validation_results['widget_validations'] if not w['valid']]
 
       if query_failures or widget_failures:
-        error_messages = []
-        if query_failures:
-          error_messages.extend([f"Dataset '{q['dataset']}': {q['error']}" for q in query_failures])
-        if widget_failures:
-          error_messages.extend(
-            [f"Widget '{w['widget_type']}': {w['error']}" for w in widget_failures]
-          )
+        error_messages = [f"Dataset '{q['dataset']}': {q['error']}" for q in query_failures]
+        error_messages.extend(f"Widget '{w['widget_type']}': {w['error']}" for w in widget_failures)
 
         return {
           'success': False,
@@ -1320,7 +1501,7 @@ def load_dashboard_tools(mcp_server):
           'validation_results': validation_results,
         }
 
-      print('✅ All SQL queries and widget fields validated successfully!')
+      logger.info('All SQL queries and widget fields validated successfully')
       return {
         'success': True,
         'message': 'All SQL queries and widget field references are valid',
@@ -1328,7 +1509,7 @@ def load_dashboard_tools(mcp_server):
       }
 
     except Exception as e:
-      return {'success': False, 'error': f'Validation failed with error: {str(e)}'}
+      return {'success': False, 'error': f'Validation failed with error: {e}'}
 
   @mcp_server.tool()
   def get_widget_configuration_guide(widget_type: str = None) -> Dict[str, Any]:
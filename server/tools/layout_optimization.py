@@ -6,43 +6,93 @@ just direct implementation of automatic layout intelligence.
 """
 
 import hashlib
-import os
 import re
+import threading
 import time
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Optional, Tuple
 
-# Simple cache using dictionary (no classes, no threading)
+try:
+  from .utils import get_workspace_client
+except ImportError:
+  from utils import get_workspace_client
+
+# Simple cache using dictionaries; the lock keeps the two in step when
+# widgets are analyzed from several threads
 ANALYSIS_CACHE = {}
 CACHE_TIMESTAMPS = {}
+_CACHE_LOCK = threading.Lock()
 CACHE_TTL = 300  # 5 minutes
 MAX_CACHE_SIZE = 100
 
+# Upper bound on concurrent warehouse round trips when analyzing widget queries
+ANALYSIS_WORKERS = 8
+
+# Query pattern detectors, compiled once and matched case-insensitively so the
+# query is never copied into lower case
+_TIME_SERIES_RE = re.compile(r'date|time|timestamp|month|year|week|day', re.IGNORECASE)
+_AGGREGATE_RE = re.compile(r'sum\(|count\(|avg\(|max\(|min\(|group by', re.IGNORECASE)
+_SINGLE_VALUE_RE = re.compile(r'count\(\*\)|sum\(.*\)|avg\(.*\)|max\(.*\)|min\(.*\)', re.IGNORECASE)
+_GROUP_BY_RE = re.compile(r'group by', re.IGNORECASE)
+_CATEGORICAL_RE = re.compile(r'group by|distinct', re.IGNORECASE)
+_METRIC_RE = re.compile(r'(sum|count|avg|max|min)\([^)]+\)', re.IGNORECASE)
+_HIERARCHICAL_RE = re.compile(r'parent|child|tree|hierarchy|level', re.IGNORECASE)
+_CURRENCY_RE = re.compile(r'price|cost|revenue|amount|salary|budget|\$', re.IGNORECASE)
+_PERCENTAGE_RE = re.compile(r'percent|rate|ratio|proportion', re.IGNORECASE)
+_GEOGRAPHY_RE = re.compile(r'country|state|city|region|location|latitude|longitude', re.IGNORECASE)
+
 
 def get_cached_result(query_hash: str) -> Optional[dict]:
   """Simple cache lookup with TTL check."""
-  if query_hash in ANALYSIS_CACHE:
-    timestamp = CACHE_TIMESTAMPS.get(query_hash, 0)
-    if time.time() - timestamp < CACHE_TTL:
-      return ANALYSIS_CACHE[query_hash]
-    else:
-      # Expired - remove it
-      del ANALYSIS_CACHE[query_hash]
-      del CACHE_TIMESTAMPS[query_hash]
+  with _CACHE_LOCK:
+    if query_hash in ANALYSIS_CACHE:
+      timestamp = CACHE_TIMESTAMPS.get(query_hash, 0)
+      if time.time() - timestamp < CACHE_TTL:
+        return ANALYSIS_CACHE[query_hash]
+      else:
+        # Expired - remove it
+        del ANALYSIS_CACHE[query_hash]
+        del CACHE_TIMESTAMPS[query_hash]
   return None
 
 
 def store_cached_result(query_hash: str, result: dict):
   """Simple cache storage with size limit."""
-  # Basic size management
-  if len(ANALYSIS_CACHE) >= MAX_CACHE_SIZE:
-    # Remove oldest entry
-    if CACHE_TIMESTAMPS:
-      oldest = min(CACHE_TIMESTAMPS, key=CACHE_TIMESTAMPS.get)
-      del ANALYSIS_CACHE[oldest]
-      del CACHE_TIMESTAMPS[oldest]
-
-  ANALYSIS_CACHE[query_hash] = result
-  CACHE_TIMESTAMPS[query_hash] = time.time()
+  with _CACHE_LOCK:
+    # Re-inserting moves the key to the end, so dict order always matches
+    # timestamp order and the oldest entry is simply the first one
+    CACHE_TIMESTAMPS.pop(query_hash, None)
+    ANALYSIS_CACHE.pop(query_hash, None)
+
+    # Basic size management
+    if len(ANALYSIS_CACHE) >= MAX_CACHE_SIZE:
+      # Remove oldest entry
+      if CACHE_TIMESTAMPS:
+        oldest = next(iter(CACHE_TIMESTAMPS))
+        del ANALYSIS_CACHE[oldest]
+        del CACHE_TIMESTAMPS[oldest]
+
+    ANALYSIS_CACHE[query_hash] = result
+    CACHE_TIMESTAMPS[query_hash] = time.time()
+
+
+def _detect_data_patterns(query: str) -> dict:
+  """Detect data patterns from the query text alone."""
+  return {
+    'is_time_series': _TIME_SERIES_RE.search(query) is not None,
+    'is_aggregate': _AGGREGATE_RE.search(query) is not None,
+    'is_single_value': (
+      _SINGLE_VALUE_RE.search(query) is not None and _GROUP_BY_RE.search(query) is None
+    ),
+    'is_categorical': _CATEGORICAL_RE.search(query) is not None,
+    # Two matches are enough to know there are multiple metrics
+    'has_multiple_metrics': next(islice(_METRIC_RE.finditer(query), 1, None), None) is not None,
+    'is_hierarchical': _HIERARCHICAL_RE.search(query) is not None,
+    'has_currency': _CURRENCY_RE.search(query) is not None,
+    'has_percentage': _PERCENTAGE_RE.search(query) is not None,
+    'has_geography': _GEOGRAPHY_RE.search(query) is not None,
+  }
 
 
 def analyze_widget_data(query: str, warehouse_id: str) -> dict:
@@ -57,31 +107,11 @@ def analyze_widget_data(query: str, warehouse_id: str) -> dict:
     if cached:
       return cached
 
-    # Get client directly
-    from databricks.sdk import WorkspaceClient
-
-    client = WorkspaceClient(host=os.getenv('DATABRICKS_HOST'), token=os.getenv('DATABRICKS_TOKEN'))
+    # Reuse the shared client instead of building one per analyzed widget
+    client = get_workspace_client()
 
     # Analyze query structure first
-    query_lower = query.lower()
-
-    # Detect data patterns from query
-    data_patterns = {
-      'is_time_series': bool(re.search(r'date|time|timestamp|month|year|week|day', query_lower)),
-      'is_aggregate': bool(re.search(r'sum\(|count\(|avg\(|max\(|min\(|group by', query_lower)),
-      'is_single_value': bool(
-        re.search(r'count\(\*\)|sum\(.*\)|avg\(.*\)|max\(.*\)|min\(.*\)', query_lower)
-        and 'group by' not in query_lower
-      ),
-      'is_categorical': bool(re.search(r'group by|distinct', query_lower)),
-      'has_multiple_metrics': len(re.findall(r'(sum|count|avg|max|min)\([^)]+\)', query_lower)) > 1,
-      'is_hierarchical': bool(re.search(r'parent|child|tree|hierarchy|level', query_lower)),
-      'has_currency': bool(re.search(r'price|cost|revenue|amount|salary|budget|\$', query_lower)),
-      'has_percentage': bool(re.search(r'percent|rate|ratio|proportion', query_lower)),
-      'has_geography': bool(
-        re.search(r'country|state|city|region|location|latitude|longitude', query_lower)
-      ),
-    }
+    data_patterns = _detect_data_patterns(query)
 
     # Sample the query to get actual data characteristics
     sampled_query = f'SELECT * FROM ({query}) base_query LIMIT 100'
@@ -151,8 +181,10 @@ def analyze_widget_data(query: str, warehouse_id: str) -> dict:
     store_cached_result(cache_key, analysis_result)
     return analysis_result
 
-  except Exception as e:
-    # Return sensible defaults on error
+  except (AttributeError, ValueError, OSError) as e:
+    # Client, config, network and API failures (DatabricksError is an OSError)
+    # return sensible defaults.
+    # Anything else is a bug and propagates to the caller's default layout.
     return {
       'row_count': 10,
       'column_count': 3,
@@ -213,10 +245,12 @@ def determine_recommended_widget(
     return 'bar'
 
 
-def calculate_widget_dimensions(widget_type: str, data_analysis: dict) -> dict:
+def calculate_widget_dimensions(widget_type: str, data_analysis: dict) -> Tuple[int, int]:
   """Calculate optimal widget dimensions based on type and data characteristics.
 
   Uses the 12-column grid system. Optimized for better visual layout.
+  Dimensions are returned as a constant (width, height) tuple rather than a
+  freshly built dict, since they are only read back during positioning.
   """
   row_count = data_analysis.get('row_count', 10)
   column_count = data_analysis.get('column_count', 3)
@@ -225,151 +259,159 @@ def calculate_widget_dimensions(widget_type: str, data_analysis: dict) -> dict:
 
   # Counter widgets - compact KPI display
   if widget_type == 'counter':
-    return {'width': 3, 'height': 2}
+    return (3, 2)
 
   # Gauge widgets - slightly larger than counters
   if widget_type == 'gauge':
-    return {'width': 3, 'height': 2}
+    return (3, 2)
 
   # Markdown/text widgets - based on content
   if widget_type == 'markdown':
-    return {'width': 6, 'height': 2}
+    return (6, 2)
 
   # Table widgets - need more space for columns
   if widget_type == 'table':
     if column_count > 8:
-      return {'width': 12, 'height': 6}
+      return (12, 6)
     elif column_count > 5:
-      return {'width': 9, 'height': 5}
+      return (9, 5)
     elif column_count > 3:
-      return {'width': 6, 'height': 5}
+      return (6, 5)
     else:
-      return {'width': 6, 'height': 4}
+      return (6, 4)
 
   # Pivot tables - always large
   if widget_type == 'pivot':
-    return {'width': 9, 'height': 6}
+    return (9, 6)
 
   # Pie charts - square-ish aspect ratio
   if widget_type == 'pie':
     if row_count > 8:
-      return {'width': 4, 'height': 4}
-    return {'width': 4, 'height': 4}
+      return (4, 4)
+    return (4, 4)
 
   # Line and area charts - wider for time series
   if widget_type in ['line', 'area']:
     if data_patterns.get('is_time_series'):
       if row_count > 100:
-        return {'width': 12, 'height': 4}
+        return (12, 4)
       elif row_count > 50:
-        return {'width': 6, 'height': 4}
+        return (6, 4)
       else:
-        return {'width': 6, 'height': 4}
-    return {'width': 6, 'height': 4}
+        return (6, 4)
+    return (6, 4)
 
   # Bar charts - width based on number of categories
   if widget_type == 'bar':
     if row_count > 20:
-      return {'width': 12, 'height': 5}
+      return (12, 5)
     elif row_count > 10:
-      return {'width': 6, 'height': 4}
+      return (6, 4)
     else:
-      return {'width': 6, 'height': 4}
+      return (6, 4)
 
   # Scatter plots - need space for point distribution
   if widget_type == 'scatter':
     if row_count > 100:
-      return {'width': 6, 'height': 5}
-    return {'width': 6, 'height': 4}
+      return (6, 5)
+    return (6, 4)
 
   # Heatmaps - wide format for better visibility
   if widget_type == 'heatmap':
-    return {'width': 12, 'height': 5}
+    return (12, 5)
 
   # Funnel charts
   if widget_type == 'funnel':
-    return {'width': 4, 'height': 4}
+    return (4, 4)
 
   # Box plots
   if widget_type == 'box':
-    return {'width': 6, 'height': 4}
+    return (6, 4)
 
   # Map widgets - need space for geographic display
   if widget_type == 'map':
-    return {'width': 6, 'height': 5}
+    return (6, 5)
 
   # Default sizing based on complexity
   if complexity_score >= 7:
-    return {'width': 6, 'height': 5}
+    return (6, 5)
   elif complexity_score >= 4:
-    return {'width': 6, 'height': 4}
+    return (6, 4)
   else:
-    return {'width': 6, 'height': 4}
+    return (6, 4)
+
+
+# Display priority per widget type: KPIs first, then trends, comparisons,
+# details, and text at the end
+WIDGET_PRIORITY = {
+  'counter': 1,  # KPIs first
+  'gauge': 1,
+  'line': 2,  # Trends second
+  'area': 2,
+  'bar': 3,  # Comparisons third
+  'pie': 3,
+  'table': 4,  # Details last
+  'pivot': 4,
+  'scatter': 5,
+  'heatmap': 5,
+  'funnel': 5,
+  'box': 5,
+  'map': 6,
+  'markdown': 7,  # Text at the end
+}
 
 
 def group_related_widgets(widgets: list) -> list:
-  """Group related widgets together based on their data patterns and names.
+  """Group related widgets together based on their widget type priority.
 
   Returns widgets in optimized order.
   """
-  # Simple grouping by widget type priority
-  priority_order = {
-    'counter': 1,  # KPIs first
-    'gauge': 1,
-    'line': 2,  # Trends second
-    'area': 2,
-    'bar': 3,  # Comparisons third
-    'pie': 3,
-    'table': 4,  # Details last
-    'pivot': 4,
-    'scatter': 5,
-    'heatmap': 5,
-    'funnel': 5,
-    'box': 5,
-    'map': 6,
-    'markdown': 7,  # Text at the end
-  }
+  # A stable sort by priority already keeps widgets of the same priority
+  # together in their original order, which is exactly the grouping; there is
+  # no need to split the widgets into groups and concatenate them back
+  return sorted(widgets, key=lambda w: WIDGET_PRIORITY.get(w.get('type', 'bar'), 10))
 
-  # Sort widgets by priority
-  sorted_widgets = sorted(widgets, key=lambda w: priority_order.get(w.get('type', 'bar'), 10))
 
-  # Group similar widgets together
-  grouped = []
-  current_group = []
-  current_type = None
+def _span_mask(x: int, width: int) -> int:
+  """Bitmask of grid columns x..x+width-1, clipped to the 12-column grid."""
+  end = min(x + width, 12)
+  if end <= x:
+    return 0
+  return ((1 << (end - x)) - 1) << x
 
-  for widget in sorted_widgets:
-    widget_type = widget.get('type', 'bar')
 
-    # Check if widget name suggests it's a KPI
-    name_lower = widget.get('name', '').lower()
-    is_kpi = any(kpi in name_lower for kpi in ['total', 'sum', 'count', 'average', 'kpi', 'metric'])
-
-    if is_kpi and widget_type in ['counter', 'gauge']:
-      # KPIs always go in the first group
-      if not grouped and current_group:
-        grouped.append(current_group)
-        current_group = []
-      current_group.append(widget)
-    elif widget_type == current_type or priority_order.get(widget_type, 10) == priority_order.get(
-      current_type, 10
-    ):
-      current_group.append(widget)
-    else:
-      if current_group:
-        grouped.append(current_group)
-      current_group = [widget]
-      current_type = widget_type
+# Grid occupancy is tracked as one integer bitmask of taken columns per row, so
+# checking or marking a widget costs one AND/OR per row instead of one dict
+# operation per cell.
+
+
+def _is_space_available(occupied: dict, x: int, y: int, width: int, height: int) -> bool:
+  """Check if a space is available in the grid."""
+  mask = _span_mask(x, width)
+  for row in range(y, y + height):
+    if occupied.get(row, 0) & mask:
+      return False
+  return True
+
 
-  if current_group:
-    grouped.append(current_group)
+def _mark_space_occupied(occupied: dict, x: int, y: int, width: int, height: int):
+  """Mark a space as occupied in the grid."""
+  mask = _span_mask(x, width)
+  for row in range(y, y + height):
+    occupied[row] = occupied.get(row, 0) | mask
 
-  # Flatten groups back to list
-  result = []
-  for group in grouped:
-    result.extend(group)
 
-  return result
+def _find_next_available_position(
+  occupied: dict, width: int, height: int, start_y: int = 0
+) -> tuple:
+  """Find the next available position for a widget of given dimensions."""
+  y = start_y
+  while y < 100:  # Reasonable limit to prevent infinite loop
+    for x in range(13 - width):  # 12 columns, ensure widget fits
+      if _is_space_available(occupied, x, y, width, height):
+        return x, y
+    y += 1
+  return 0, y  # Fallback to leftmost position
 
 
 def position_widgets(widgets: list) -> list:
@@ -381,44 +423,24 @@ def position_widgets(widgets: list) -> list:
   widgets = group_related_widgets(widgets)
 
   # Track occupied cells in the grid
-  occupied = {}  # Key: (x, y), Value: True if occupied
-
-  def is_space_available(x: int, y: int, width: int, height: int) -> bool:
-    """Check if a space is available in the grid."""
-    for row in range(y, y + height):
-      for col in range(x, x + width):
-        if (col, row) in occupied:
-          return False
-    return True
-
-  def mark_space_occupied(x: int, y: int, width: int, height: int):
-    """Mark a space as occupied in the grid."""
-    for row in range(y, y + height):
-      for col in range(x, x + width):
-        occupied[(col, row)] = True
-
-  def find_next_available_position(width: int, height: int, start_y: int = 0) -> tuple:
-    """Find the next available position for a widget of given dimensions."""
-    y = start_y
-    while y < 100:  # Reasonable limit to prevent infinite loop
-      for x in range(13 - width):  # 12 columns, ensure widget fits
-        if is_space_available(x, y, width, height):
-          return x, y
-      y += 1
-    return 0, y  # Fallback to leftmost position
+  occupied = {}  # Key: row, Value: bitmask of occupied columns
 
   current_y = 0
   kpi_widgets = []
+  other_widgets = []
 
-  # First pass: collect all KPI widgets
-  for i, widget in enumerate(widgets):
+  # First pass: split KPI widgets from the rest once, so neither placement
+  # loop has to re-check widget types
+  for widget in widgets:
+    widget_type = widget.get('type', 'bar')
     if 'dimensions' not in widget:
       data = widget.get('data_analysis', {})
-      widget['dimensions'] = calculate_widget_dimensions(widget.get('type', 'bar'), data)
+      widget['dimensions'] = calculate_widget_dimensions(widget_type, data)
 
-    widget_type = widget.get('type', 'bar')
-    if widget_type in ['counter', 'gauge']:
-      kpi_widgets.append((i, widget))
+    if widget_type in ('counter', 'gauge'):
+      kpi_widgets.append(widget)
+    else:
+      other_widgets.append(widget)
 
   # Position KPI widgets first (they should be at the top)
   if kpi_widgets:
@@ -426,51 +448,44 @@ def position_widgets(widgets: list) -> list:
     kpi_row_y = 0
     kpi_row_height = 0
 
-    for idx, widget in kpi_widgets:
-      dims = widget['dimensions']
+    for widget in kpi_widgets:
+      width, height = widget['dimensions']
 
       # Check if we need to move to next row
-      if kpi_row_x + dims['width'] > 12:
+      if kpi_row_x + width > 12:
         kpi_row_y += kpi_row_height
         kpi_row_x = 0
         kpi_row_height = 0
 
       # Set position
-      widget['position'] = {
-        'x': kpi_row_x,
-        'y': kpi_row_y,
-        'width': dims['width'],
-        'height': dims['height'],
-      }
+      widget['position'] = {'x': kpi_row_x, 'y': kpi_row_y, 'width': width, 'height': height}
 
       # Mark space as occupied
-      mark_space_occupied(kpi_row_x, kpi_row_y, dims['width'], dims['height'])
+      _mark_space_occupied(occupied, kpi_row_x, kpi_row_y, width, height)
 
       # Update for next KPI widget
-      kpi_row_x += dims['width']
-      kpi_row_height = max(kpi_row_height, dims['height'])
+      kpi_row_x += width
+      kpi_row_height = max(kpi_row_height, height)
 
     # Update starting Y for non-KPI widgets
     current_y = kpi_row_y + kpi_row_height
 
   # Position non-KPI widgets
-  for i, widget in enumerate(widgets):
-    widget_type = widget.get('type', 'bar')
-
-    # Skip if already positioned (KPI widgets)
+  for widget in other_widgets:
+    # Skip if already positioned manually
     if 'position' in widget:
       continue
 
-    dims = widget['dimensions']
+    width, height = widget['dimensions']
 
     # Find best position for this widget
-    x, y = find_next_available_position(dims['width'], dims['height'], current_y)
+    x, y = _find_next_available_position(occupied, width, height, current_y)
 
     # Set position
-    widget['position'] = {'x': x, 'y': y, 'width': dims['width'], 'height': dims['height']}
+    widget['position'] = {'x': x, 'y': y, 'width': width, 'height': height}
 
     # Mark space as occupied
-    mark_space_occupied(x, y, dims['width'], dims['height'])
+    _mark_space_occupied(occupied, x, y, width, height)
 
     # Update current_y to encourage row-based layout
     if x == 0:  # Started a new row
@@ -479,47 +494,48 @@ def position_widgets(widgets: list) -> list:
   return widgets
 
 
-def detect_and_fix_overlaps(widgets: list) -> list:
+# Shared default for widgets without a position, so sorting does not allocate
+# an empty dict per widget
+_EMPTY_POSITION = {}
+
+
+def _position_sort_key(widget: dict) -> Tuple[int, int]:
+  """Sort key ordering widgets top-to-bottom, then left-to-right."""
+  pos = widget.get('position') or _EMPTY_POSITION
+  return (pos.get('y', 0), pos.get('x', 0))
+
+
+def _find_free_position(occupied: dict, width: int, height: int, start_y: int = 0) -> tuple:
+  """Find next available position for a widget."""
+  for y in range(start_y, start_y + 50):  # Reasonable search limit
+    for x in range(13 - width):  # Ensure widget fits horizontally
+      if _is_space_available(occupied, x, y, width, height):
+        return x, y
+  # Fallback: place at the bottom
+  return 0, start_y + 50
+
+
+def detect_and_fix_overlaps(widgets: list, in_place: bool = False) -> list:
   """Detect and fix any overlapping widgets in the layout.
 
-  More robust implementation that handles all edge cases.
+  More robust implementation that handles all edge cases. Positions are always
+  fixed on the widget dicts themselves; with in_place=True the given list is
+  also reordered instead of copied, for callers that own it.
   """
   if not widgets:
     return widgets
 
   # Sort widgets by position for consistent processing
-  widgets = sorted(
-    widgets, key=lambda w: (w.get('position', {}).get('y', 0), w.get('position', {}).get('x', 0))
-  )
+  if in_place:
+    widgets.sort(key=_position_sort_key)
+  else:
+    widgets = sorted(widgets, key=_position_sort_key)
 
   # Track occupied spaces
-  occupied = {}  # Key: (x, y), Value: widget index
-
-  def is_overlapping(x: int, y: int, width: int, height: int, widget_idx: int) -> bool:
-    """Check if a widget position overlaps with already placed widgets."""
-    for row in range(y, y + height):
-      for col in range(x, min(x + width, 12)):  # Ensure we don't go beyond grid
-        if (col, row) in occupied and occupied[(col, row)] != widget_idx:
-          return True
-    return False
-
-  def mark_occupied(x: int, y: int, width: int, height: int, widget_idx: int):
-    """Mark cells as occupied by a widget."""
-    for row in range(y, y + height):
-      for col in range(x, min(x + width, 12)):
-        occupied[(col, row)] = widget_idx
-
-  def find_free_position(width: int, height: int, start_y: int = 0) -> tuple:
-    """Find next available position for a widget."""
-    for y in range(start_y, start_y + 50):  # Reasonable search limit
-      for x in range(13 - width):  # Ensure widget fits horizontally
-        if not is_overlapping(x, y, width, height, -1):
-          return x, y
-    # Fallback: place at the bottom
-    return 0, start_y + 50
+  occupied = {}  # Key: row, Value: bitmask of occupied columns
 
   # Process each widget
-  for i, widget in enumerate(widgets):
+  for widget in widgets:
     if 'position' not in widget:
       continue
 
@@ -539,20 +555,12 @@ def detect_and_fix_overlaps(widgets: list) -> list:
         pos['x'] = 0
 
     # Check for overlap
-    if is_overlapping(pos['x'], pos['y'], pos['width'], pos['height'], i):
+    if not _is_space_available(occupied, pos['x'], pos['y'], pos['width'], pos['height']):
       # Find new position
-      new_x, new_y = find_free_position(pos['width'], pos['height'], pos['y'])
-      widget['position']['x'] = new_x
-      widget['position']['y'] = new_y
+      pos['x'], pos['y'] = _find_free_position(occupied, pos['width'], pos['height'], pos['y'])
 
     # Mark as occupied
-    mark_occupied(
-      widget['position']['x'],
-      widget['position']['y'],
-      widget['position']['width'],
-      widget['position']['height'],
-      i,
-    )
+    _mark_space_occupied(occupied, pos['x'], pos['y'], pos['width'], pos['height'])
 
   return widgets
 
@@ -563,29 +571,55 @@ def optimize_dashboard_layout(widgets: list, warehouse_id: str, datasets: list =
   Analyzes data, calculates dimensions, and positions widgets intelligently.
   """
   optimized_widgets = []
+  pending = []  # (widget copy, query) for widgets that still need placement
+  needs_placement = False
+
+  # Index dataset queries by name once instead of scanning datasets per widget
+  # (the first dataset with a given name wins, as with the previous scan)
+  dataset_queries = {}
+  for ds in datasets or ():
+    dataset_queries.setdefault(ds.get('name'), ds.get('query'))
 
   for widget in widgets:
+    # Skip if position is already manually specified. The position dict is
+    # copied in the same step because overlap fixing edits it in place.
+    if 'position' in widget:
+      # KPI widgets are always moved to the top row, even when positioned
+      if widget.get('type') in ('counter', 'gauge'):
+        needs_placement = True
+      optimized_widgets.append({**widget, 'position': dict(widget['position'])})
+      continue
+
     widget_copy = widget.copy()
+    optimized_widgets.append(widget_copy)
 
-    # Skip if position is already manually specified
-    if 'position' in widget_copy:
-      optimized_widgets.append(widget_copy)
-      continue
+    needs_placement = True
 
     # Get query from widget or dataset
     query = None
     if 'query' in widget_copy:
       query = widget_copy['query']
-    elif 'dataset' in widget_copy and datasets:
+    elif 'dataset' in widget_copy:
       # Find matching dataset
-      for ds in datasets:
-        if ds.get('name') == widget_copy['dataset']:
-          query = ds.get('query')
-          break
-
+      query = dataset_queries.get(widget_copy['dataset'])
+
+    pending.append((widget_copy, query))
+
+  # Analyze each distinct query once, concurrently. Every analysis is an
+  # independent warehouse round trip, so this costs about one round trip
+  # instead of one per widget.
+  analyses = {}
+  if warehouse_id:
+    queries = list(dict.fromkeys(query for _, query in pending if query))
+    if queries:
+      with ThreadPoolExecutor(max_workers=min(ANALYSIS_WORKERS, len(queries))) as executor:
+        results = executor.map(lambda query: analyze_widget_data(query, warehouse_id), queries)
+        analyses = dict(zip(queries, results))
+
+  for widget_copy, query in pending:
     # Analyze data if we have a query
     if query and warehouse_id:
-      analysis = analyze_widget_data(query, warehouse_id)
+      analysis = analyses[query]
       widget_copy['data_analysis'] = analysis
 
       # Use recommended widget type if not specified
@@ -600,13 +634,13 @@ def optimize_dashboard_layout(widgets: list, warehouse_id: str, datasets: list =
       widget_copy.get('type', 'bar'), widget_copy.get('data_analysis', {})
     )
 
-    optimized_widgets.append(widget_copy)
-
-  # Position all widgets
-  optimized_widgets = position_widgets(optimized_widgets)
+  # Position all widgets, unless the placement pass would be a no-op because
+  # every widget already has its final position
+  if needs_placement:
+    optimized_widgets = position_widgets(optimized_widgets)
 
-  # Fix any overlaps
-  optimized_widgets = detect_and_fix_overlaps(optimized_widgets)
+  # Fix any overlaps; the list was built above, so it can be reordered in place
+  optimized_widgets = detect_and_fix_overlaps(optimized_widgets, in_place=True)
 
   return optimized_widgets
 
@@ -625,17 +659,21 @@ def validate_layout(widgets: list) -> dict:
       issues.append(f"Widget '{widget.get('name', 'unnamed')}' missing position")
       continue
 
+    # Read the position once into locals for the checks below
     pos = widget['position']
-    if pos['x'] < 0 or pos['x'] >= 12:
-      issues.append(f"Widget '{widget.get('name', 'unnamed')}' x position {pos['x']} out of bounds")
-    if pos['y'] < 0:
-      issues.append(f"Widget '{widget.get('name', 'unnamed')}' y position {pos['y']} is negative")
-    if pos['width'] <= 0 or pos['width'] > 12:
-      issues.append(f"Widget '{widget.get('name', 'unnamed')}' width {pos['width']} invalid")
-    if pos['height'] <= 0:
-      issues.append(f"Widget '{widget.get('name', 'unnamed')}' height {pos['height']} invalid")
-    if pos['x'] + pos['width'] > 12:
-      warnings.append(f"Widget '{widget.get('name', 'unnamed')}' extends beyond grid boundary")
+    x, y, width, height = pos['x'], pos['y'], pos['width'], pos['height']
+    name = widget.get('name', 'unnamed')
+
+    if x < 0 or x >= 12:
+      issues.append(f"Widget '{name}' x position {x} out of bounds")
+    if y < 0:
+      issues.append(f"Widget '{name}' y position {y} is negative")
+    if width <= 0 or width > 12:
+      issues.append(f"Widget '{name}' width {width} invalid")
+    if height <= 0:
+      issues.append(f"Widget '{name}' height {height} invalid")
+    if x + width > 12:
+      warnings.append(f"Widget '{name}' extends beyond grid boundary")
 
   # Check for excessive vertical spacing
   if widgets:
@@ -1,9 +1,45 @@
 """SQL operations MCP tools for Databricks."""
 
+import heapq
+import logging
 import os
+from itertools import islice
 
 from databricks.sdk import WorkspaceClient
 
+from .utils import get_workspace_client, wait_for_statement
+
+logger = logging.getLogger(__name__)
+
+
+def _warehouse_to_dict(warehouse) -> dict:
+  """Convert an SDK warehouse listing entry into a response row."""
+  return {
+    'id': warehouse.id,
+    'name': warehouse.name,
+    'state': getattr(warehouse, 'state', None),
+    'cluster_size': getattr(warehouse, 'cluster_size', None),
+    'min_num_clusters': getattr(warehouse, 'min_num_clusters', None),
+    'max_num_clusters': getattr(warehouse, 'max_num_clusters', None),
+    'auto_stop_mins': getattr(warehouse, 'auto_stop_mins', None),
+    'enable_serverless_compute': getattr(warehouse, 'enable_serverless_compute', False),
+    'created_time': getattr(warehouse, 'created_time', None),
+    'updated_time': getattr(warehouse, 'updated_time', None),
+  }
+
+
+def _statement_summary(query) -> dict:
+  """Convert an SDK statement listing entry into a response row."""
+  statement = query.statement
+  return {
+    'id': query.id,
+    'warehouse_id': query.warehouse_id,
+    'status': query.status,
+    'created_time': query.created_time,
+    'completed_time': query.completed_time,
+    'statement': statement[:100] + '...' if len(statement) > 100 else statement,
+  }
+
 
 def load_sql_tools(mcp_server):
   """Register SQL operation MCP tools with the server.
@@ -34,9 +70,7 @@ def load_sql_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Get warehouse ID from parameter or environment
       warehouse_id = warehouse_id or os.environ.get('DATABRICKS_SQL_WAREHOUSE_ID')
@@ -53,23 +87,19 @@ def load_sql_tools(mcp_server):
       if catalog and schema:
         full_query = f'USE CATALOG {catalog}; USE SCHEMA {schema}; {query}'
 
-      print(f'🔧 Executing SQL on warehouse {warehouse_id}: {query[:100]}...')
+      logger.info('Executing SQL on warehouse %s: %s...', warehouse_id, query[:100])
 
-      # Execute the query
+      # Execute the query; short first wait, then poll only if it is still running
       result = w.statement_execution.execute_statement(
-        warehouse_id=warehouse_id, statement=full_query, wait_timeout='30s'
+        warehouse_id=warehouse_id, statement=full_query, wait_timeout='5s'
       )
+      result = wait_for_statement(w, result)
 
       # Process results
       if result.result and result.result.data_array:
         columns = [col.name for col in result.manifest.schema.columns]
-        data = []
-
-        for row in result.result.data_array[:limit]:
-          row_dict = {}
-          for i, col in enumerate(columns):
-            row_dict[col] = row[i]
-          data.append(row_dict)
+        # limit is not part of the statement, so truncate here without copying the array
+        data = [dict(zip(columns, row)) for row in islice(result.result.data_array, limit)]
 
         return {'success': True, 'data': {'columns': columns, 'rows': data}, 'row_count': len(data)}
       else:
@@ -80,8 +110,8 @@ def load_sql_tools(mcp_server):
         }
 
     except Exception as e:
-      print(f'❌ Error executing SQL: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error executing SQL: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def list_warehouses() -> dict:
@@ -92,29 +122,10 @@ def load_sql_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # List all warehouses
-      warehouses = w.warehouses.list()
-
-      warehouse_list = []
-      for warehouse in warehouses:
-        warehouse_list.append(
-          {
-            'id': warehouse.id,
-            'name': warehouse.name,
-            'state': getattr(warehouse, 'state', None),
-            'cluster_size': getattr(warehouse, 'cluster_size', None),
-            'min_num_clusters': getattr(warehouse, 'min_num_clusters', None),
-            'max_num_clusters': getattr(warehouse, 'max_num_clusters', None),
-            'auto_stop_mins': getattr(warehouse, 'auto_stop_mins', None),
-            'enable_serverless_compute': getattr(warehouse, 'enable_serverless_compute', False),
-            'created_time': getattr(warehouse, 'created_time', None),
-            'updated_time': getattr(warehouse, 'updated_time', None),
-          }
-        )
+      warehouse_list = [_warehouse_to_dict(warehouse) for warehouse in w.warehouses.list()]
 
       return {
         'success': True,
@@ -124,8 +135,8 @@ def load_sql_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error listing warehouses: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}', 'warehouses': [], 'count': 0}
+      logger.error('Error listing warehouses: %s', e)
+      return {'success': False, 'error': f'Error: {e}', 'warehouses': [], 'count': 0}
 
   @mcp_server.tool()
   def get_sql_warehouse(warehouse_id: str) -> dict:
@@ -139,9 +150,7 @@ def load_sql_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Get warehouse details
       warehouse = w.warehouses.get(warehouse_id)
@@ -167,8 +176,8 @@ def load_sql_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error getting warehouse details: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error getting warehouse details: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def create_sql_warehouse(warehouse_config: dict) -> dict:
@@ -182,9 +191,7 @@ def load_sql_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Create warehouse
       warehouse = w.warehouses.create(
@@ -204,8 +211,8 @@ def load_sql_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error creating warehouse: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error creating warehouse: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def start_sql_warehouse(warehouse_id: str) -> dict:
@@ -219,9 +226,7 @@ def load_sql_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Start warehouse
       w.warehouses.start(warehouse_id)
@@ -233,8 +238,8 @@ def load_sql_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error starting warehouse: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error starting warehouse: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def stop_sql_warehouse(warehouse_id: str) -> dict:
@@ -248,9 +253,7 @@ def load_sql_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Stop warehouse
       w.warehouses.stop(warehouse_id)
@@ -262,8 +265,8 @@ def load_sql_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error stopping warehouse: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error stopping warehouse: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def delete_sql_warehouse(warehouse_id: str) -> dict:
@@ -277,9 +280,7 @@ def load_sql_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Delete warehouse
       w.warehouses.delete(warehouse_id)
@@ -291,8 +292,8 @@ def load_sql_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error deleting warehouse: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error deleting warehouse: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def list_queries(warehouse_id: str = None) -> dict:
@@ -306,31 +307,16 @@ def load_sql_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # List queries
       queries = w.statement_execution.list_statements()
 
-      # Filter by warehouse if specified
+      # Filter by warehouse if specified, streaming over the listing
       if warehouse_id:
-        queries = [q for q in queries if q.warehouse_id == warehouse_id]
-
-      query_list = []
-      for query in queries:
-        query_list.append(
-          {
-            'id': query.id,
-            'warehouse_id': query.warehouse_id,
-            'status': query.status,
-            'created_time': query.created_time,
-            'completed_time': query.completed_time,
-            'statement': query.statement[:100] + '...'
-            if len(query.statement) > 100
-            else query.statement,
-          }
-        )
+        queries = (q for q in queries if q.warehouse_id == warehouse_id)
+
+      query_list = [_statement_summary(query) for query in queries]
 
       return {
         'success': True,
@@ -342,8 +328,8 @@ def load_sql_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error listing queries: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}', 'queries': [], 'count': 0}
+      logger.error('Error listing queries: %s', e)
+      return {'success': False, 'error': f'Error: {e}', 'queries': [], 'count': 0}
 
   @mcp_server.tool()
   def get_query(query_id: str) -> dict:
@@ -357,9 +343,7 @@ def load_sql_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Get query details
       query = w.statement_execution.get_statement(query_id)
@@ -385,8 +369,8 @@ def load_sql_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error getting query details: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error getting query details: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def get_query_results(query_id: str) -> dict:
@@ -400,9 +384,7 @@ def load_sql_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Get query results
       query = w.statement_execution.get_statement(query_id)
@@ -434,8 +416,8 @@ def load_sql_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error getting query results: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error getting query results: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def cancel_query(query_id: str) -> dict:
@@ -449,9 +431,7 @@ def load_sql_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Cancel query
       w.statement_execution.cancel_statement(query_id)
@@ -463,8 +443,8 @@ def load_sql_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error cancelling query: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error cancelling query: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def get_statement_status(statement_id: str) -> dict:
@@ -478,9 +458,7 @@ def load_sql_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Get statement status
       statement = w.statement_execution.get_statement(statement_id)
@@ -496,8 +474,8 @@ def load_sql_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error getting statement status: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error getting statement status: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def get_statement_results(statement_id: str) -> dict:
@@ -511,9 +489,7 @@ def load_sql_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Get statement results
       statement = w.statement_execution.get_statement(statement_id)
@@ -545,8 +521,8 @@ def load_sql_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error getting statement results: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error getting statement results: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def cancel_statement(statement_id: str) -> dict:
@@ -560,9 +536,7 @@ def load_sql_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Cancel statement
       w.statement_execution.cancel_statement(statement_id)
@@ -574,8 +548,8 @@ def load_sql_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error cancelling statement: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error cancelling statement: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def list_recent_queries(limit: int = 100) -> dict:
@@ -589,30 +563,16 @@ def load_sql_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # List recent queries
       queries = w.statement_execution.list_statements()
 
-      # Sort by creation time and limit results
-      sorted_queries = sorted(queries, key=lambda x: x.created_time, reverse=True)[:limit]
-
-      query_list = []
-      for query in sorted_queries:
-        query_list.append(
-          {
-            'id': query.id,
-            'warehouse_id': query.warehouse_id,
-            'status': query.status,
-            'created_time': query.created_time,
-            'completed_time': query.completed_time,
-            'statement': query.statement[:100] + '...'
-            if len(query.statement) > 100
-            else query.statement,
-          }
-        )
+      # Keep only the newest `limit` queries while streaming the listing,
+      # instead of sorting the full history and slicing it
+      sorted_queries = heapq.nlargest(limit, queries, key=lambda x: x.created_time)
+
+      query_list = [_statement_summary(query) for query in sorted_queries]
 
       return {
         'success': True,
@@ -623,5 +583,5 @@ def load_sql_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error listing recent queries: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}', 'queries': [], 'count': 0}
+      logger.error('Error listing recent queries: %s', e)
+      return {'success': False, 'error': f'Error: {e}', 'queries': [], 'count': 0}
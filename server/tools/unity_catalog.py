@@ -1,9 +1,44 @@
 """Unity Catalog MCP tools for Databricks."""
 
-import os
+import logging
+from operator import attrgetter
 
 from databricks.sdk import WorkspaceClient
 
+from .utils import get_workspace_client
+
+logger = logging.getLogger(__name__)
+
+# Response fields copied from SDK schema and table objects. Each getter fetches
+# all of them in one C-level call, zipped back with the field names.
+_SCHEMA_FIELDS = ('name', 'comment', 'owner', 'created_at', 'updated_at', 'properties')
+_SCHEMA_VALUES = attrgetter(*_SCHEMA_FIELDS)
+_TABLE_FIELDS = ('name', 'table_type', 'comment', 'owner', 'created_at', 'updated_at', 'properties')
+_TABLE_VALUES = attrgetter(*_TABLE_FIELDS)
+
+
+def _schema_to_dict(schema) -> dict:
+  """Convert an SDK schema object into a response row."""
+  return dict(zip(_SCHEMA_FIELDS, _SCHEMA_VALUES(schema)))
+
+
+def _table_to_dict(table) -> dict:
+  """Convert an SDK table listing entry into a response row."""
+  return dict(zip(_TABLE_FIELDS, _TABLE_VALUES(table)))
+
+
+def _column_to_dict(col, include_position: bool = False) -> dict:
+  """Convert an SDK column object into a response row."""
+  column = {
+    'name': col.name,
+    'type': col.type_text,
+    'comment': col.comment,
+    'nullable': col.nullable,
+  }
+  if include_position:
+    column['position'] = col.position
+  return column
+
 
 def load_uc_tools(mcp_server):
   """Register Unity Catalog MCP tools with the server.
@@ -27,9 +62,7 @@ def load_uc_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Get catalog details
       catalog = w.catalogs.get(catalog_name)
@@ -37,18 +70,7 @@ def load_uc_tools(mcp_server):
       # List schemas in the catalog
       schemas = w.schemas.list(catalog_name=catalog_name)
 
-      schema_list = []
-      for schema in schemas:
-        schema_list.append(
-          {
-            'name': schema.name,
-            'comment': schema.comment,
-            'owner': schema.owner,
-            'created_at': schema.created_at,
-            'updated_at': schema.updated_at,
-            'properties': schema.properties,
-          }
-        )
+      schema_list = [_schema_to_dict(schema) for schema in schemas]
 
       return {
         'success': True,
@@ -69,8 +91,8 @@ def load_uc_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error describing catalog: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error describing catalog: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def list_uc_schemas(catalog_name: str) -> dict:
@@ -84,25 +106,12 @@ def load_uc_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # List schemas in the catalog
       schemas = w.schemas.list(catalog_name=catalog_name)
 
-      schema_list = []
-      for schema in schemas:
-        schema_list.append(
-          {
-            'name': schema.name,
-            'comment': schema.comment,
-            'owner': schema.owner,
-            'created_at': schema.created_at,
-            'updated_at': schema.updated_at,
-            'properties': schema.properties,
-          }
-        )
+      schema_list = [_schema_to_dict(schema) for schema in schemas]
 
       return {
         'success': True,
@@ -113,8 +122,8 @@ def load_uc_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error listing schemas: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}', 'schemas': [], 'count': 0}
+      logger.error('Error listing schemas: %s', e)
+      return {'success': False, 'error': f'Error: {e}', 'schemas': [], 'count': 0}
 
   @mcp_server.tool()
   def describe_uc_schema(
@@ -137,9 +146,7 @@ def load_uc_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Get schema details
       schema = w.schemas.get(f'{catalog_name}.{schema_name}')
@@ -149,41 +156,17 @@ def load_uc_tools(mcp_server):
 
       table_list = []
       for table in tables:
-        table_info = {
-          'name': table.name,
-          'table_type': table.table_type,
-          'comment': table.comment,
-          'owner': table.owner,
-          'created_at': table.created_at,
-          'updated_at': table.updated_at,
-          'properties': table.properties,
-        }
+        table_info = _table_to_dict(table)
 
-        if include_columns and hasattr(table, 'columns'):
-          columns = []
-          for col in table.columns:
-            columns.append(
-              {
-                'name': col.name,
-                'type': col.type_text,
-                'comment': col.comment,
-                'nullable': col.nullable,
-              }
-            )
-          table_info['columns'] = columns
+        table_columns = getattr(table, 'columns', None) if include_columns else None
+        if table_columns is not None:
+          table_info['columns'] = [_column_to_dict(col) for col in table_columns]
 
         table_list.append(table_info)
 
       return {
         'success': True,
-        'schema': {
-          'name': schema.name,
-          'comment': schema.comment,
-          'owner': schema.owner,
-          'created_at': schema.created_at,
-          'updated_at': schema.updated_at,
-          'properties': schema.properties,
-        },
+        'schema': _schema_to_dict(schema),
         'tables': table_list,
         'table_count': len(table_list),
         'include_columns': include_columns,
@@ -194,8 +177,8 @@ def load_uc_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error describing schema: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error describing schema: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def list_uc_tables(catalog_name: str, schema_name: str) -> dict:
@@ -210,26 +193,12 @@ def load_uc_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # List tables in the schema
       tables = w.tables.list(catalog_name=catalog_name, schema_name=schema_name)
 
-      table_list = []
-      for table in tables:
-        table_list.append(
-          {
-            'name': table.name,
-            'table_type': table.table_type,
-            'comment': table.comment,
-            'owner': table.owner,
-            'created_at': table.created_at,
-            'updated_at': table.updated_at,
-            'properties': table.properties,
-          }
-        )
+      table_list = [_table_to_dict(table) for table in tables]
 
       return {
         'success': True,
@@ -241,8 +210,8 @@ def load_uc_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error listing tables: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}', 'tables': [], 'count': 0}
+      logger.error('Error listing tables: %s', e)
+      return {'success': False, 'error': f'Error: {e}', 'tables': [], 'count': 0}
 
   @mcp_server.tool()
   def describe_uc_table(table_name: str, include_lineage: bool = False) -> dict:
@@ -268,31 +237,20 @@ def load_uc_tools(mcp_server):
       catalog_name, schema_name, table_name_only = parts
 
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Get table details
       table = w.tables.get(f'{catalog_name}.{schema_name}.{table_name_only}')
 
       # Get column information
-      columns = []
-      if hasattr(table, 'columns'):
-        for col in table.columns:
-          columns.append(
-            {
-              'name': col.name,
-              'type': col.type_text,
-              'comment': col.comment,
-              'nullable': col.nullable,
-              'position': col.position,
-            }
-          )
+      table_columns = getattr(table, 'columns', None) or ()
+      columns = [_column_to_dict(col, include_position=True) for col in table_columns]
 
       # Get partitioning information
       partitioning = []
-      if hasattr(table, 'partitioning') and table.partitioning:
-        for part in table.partitioning:
+      table_partitioning = getattr(table, 'partitioning', None)
+      if table_partitioning:
+        for part in table_partitioning:
           partitioning.append(
             {
               'name': part.name,
@@ -311,7 +269,7 @@ def load_uc_tools(mcp_server):
         'properties': table.properties,
         'columns': columns,
         'partitioning': partitioning,
-        'storage_location': table.storage_location if hasattr(table, 'storage_location') else None,
+        'storage_location': getattr(table, 'storage_location', None),
       }
 
       # Add lineage information if requested
@@ -332,8 +290,8 @@ def load_uc_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error describing table: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error describing table: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def list_uc_volumes(catalog_name: str, schema_name: str) -> dict:
@@ -348,9 +306,7 @@ def load_uc_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # List volumes in the schema
       volumes = w.volumes.list(catalog_name=catalog_name, schema_name=schema_name)
@@ -380,8 +336,8 @@ def load_uc_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error listing volumes: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}', 'volumes': [], 'count': 0}
+      logger.error('Error listing volumes: %s', e)
+      return {'success': False, 'error': f'Error: {e}', 'volumes': [], 'count': 0}
 
   @mcp_server.tool()
   def describe_uc_volume(volume_name: str) -> dict:
@@ -402,9 +358,7 @@ def load_uc_tools(mcp_server):
       catalog_name, schema_name, volume_name_only = parts
 
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Get volume details
       volume = w.volumes.get(f'{catalog_name}.{schema_name}.{volume_name_only}')
@@ -420,16 +374,14 @@ def load_uc_tools(mcp_server):
           'created_at': volume.created_at,
           'updated_at': volume.updated_at,
           'properties': volume.properties,
-          'storage_location': volume.storage_location
-          if hasattr(volume, 'storage_location')
-          else None,
+          'storage_location': getattr(volume, 'storage_location', None),
         },
         'message': f'Volume {volume_name} details retrieved successfully',
       }
 
     except Exception as e:
-      print(f'❌ Error describing volume: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error describing volume: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def list_uc_functions(catalog_name: str, schema_name: str) -> dict:
@@ -444,9 +396,7 @@ def load_uc_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # List functions in the schema
       functions = w.functions.list(catalog_name=catalog_name, schema_name=schema_name)
@@ -476,8 +426,8 @@ def load_uc_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error listing functions: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}', 'functions': [], 'count': 0}
+      logger.error('Error listing functions: %s', e)
+      return {'success': False, 'error': f'Error: {e}', 'functions': [], 'count': 0}
 
   @mcp_server.tool()
   def describe_uc_function(function_name: str) -> dict:
@@ -501,9 +451,7 @@ def load_uc_tools(mcp_server):
       catalog_name, schema_name, function_name_only = parts
 
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Get function details
       func = w.functions.get(f'{catalog_name}.{schema_name}.{function_name_only}')
@@ -519,15 +467,15 @@ def load_uc_tools(mcp_server):
           'created_at': func.created_at,
           'updated_at': func.updated_at,
           'properties': func.properties,
-          'parameters': func.parameters if hasattr(func, 'parameters') else None,
-          'return_type': func.return_type if hasattr(func, 'return_type') else None,
+          'parameters': getattr(func, 'parameters', None),
+          'return_type': getattr(func, 'return_type', None),
         },
         'message': f'Function {function_name} details retrieved successfully',
       }
 
     except Exception as e:
-      print(f'❌ Error describing function: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error describing function: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def list_uc_models(catalog_name: str, schema_name: str) -> dict:
@@ -542,9 +490,7 @@ def load_uc_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # List models in the schema
       models = w.models.list(catalog_name=catalog_name, schema_name=schema_name)
@@ -572,8 +518,8 @@ def load_uc_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error listing models: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}', 'models': [], 'count': 0}
+      logger.error('Error listing models: %s', e)
+      return {'success': False, 'error': f'Error: {e}', 'models': [], 'count': 0}
 
   @mcp_server.tool()
   def describe_uc_model(model_name: str) -> dict:
@@ -594,9 +540,7 @@ def load_uc_tools(mcp_server):
       catalog_name, schema_name, model_name_only = parts
 
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Get model details
       model = w.models.get(f'{catalog_name}.{schema_name}.{model_name_only}')
@@ -611,14 +555,14 @@ def load_uc_tools(mcp_server):
           'created_at': model.created_at,
           'updated_at': model.updated_at,
           'tags': model.tags,
-          'description': model.description if hasattr(model, 'description') else None,
+          'description': getattr(model, 'description', None),
         },
         'message': f'Model {model_name} details retrieved successfully',
       }
 
     except Exception as e:
-      print(f'❌ Error describing model: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error describing model: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def list_uc_tags(catalog_name: str = None) -> dict:
@@ -630,30 +574,20 @@ def load_uc_tools(mcp_server):
     Returns:
         Dictionary with tag listings or error message
     """
-    try:
-      # Initialize Databricks SDK
-      WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
-
-      # Note: Tag listing may require specific permissions
-      # This is a placeholder for the concept
-      return {
-        'success': True,
-        'catalog': catalog_name,
-        'message': f'Tag listing initiated for catalog {catalog_name}'
-        if catalog_name
-        else 'Tag listing initiated for all catalogs',
-        'note': (
-          'Tag listing requires specific permissions and may not be directly accessible via SDK'
-        ),
-        'tags': [],
-        'count': 0,
-      }
-
-    except Exception as e:
-      print(f'❌ Error listing tags: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}', 'tags': [], 'count': 0}
+    # Note: Tag listing may require specific permissions
+    # This is a placeholder for the concept
+    return {
+      'success': True,
+      'catalog': catalog_name,
+      'message': f'Tag listing initiated for catalog {catalog_name}'
+      if catalog_name
+      else 'Tag listing initiated for all catalogs',
+      'note': (
+        'Tag listing requires specific permissions and may not be directly accessible via SDK'
+      ),
+      'tags': [],
+      'count': 0,
+    }
 
   @mcp_server.tool()
   def apply_uc_tags(object_name: str, tags: dict) -> dict:
@@ -666,27 +600,17 @@ def load_uc_tools(mcp_server):
     Returns:
         Dictionary with operation result or error message
     """
-    try:
-      # Initialize Databricks SDK
-      WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
-
-      # Note: Tag application requires specific permissions
-      # This is a placeholder for the concept
-      return {
-        'success': True,
-        'object_name': object_name,
-        'tags': tags,
-        'message': f'Tag application initiated for {object_name}',
-        'note': (
-          'Tag application requires specific permissions and may not be directly accessible via SDK'
-        ),
-      }
-
-    except Exception as e:
-      print(f'❌ Error applying tags: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+    # Note: Tag application requires specific permissions
+    # This is a placeholder for the concept
+    return {
+      'success': True,
+      'object_name': object_name,
+      'tags': tags,
+      'message': f'Tag application initiated for {object_name}',
+      'note': (
+        'Tag application requires specific permissions and may not be directly accessible via SDK'
+      ),
+    }
 
   @mcp_server.tool()
   def search_uc_objects(query: str, object_types: list = None) -> dict:
@@ -699,30 +623,20 @@ def load_uc_tools(mcp_server):
     Returns:
         Dictionary with search results or error message
     """
-    try:
-      # Initialize Databricks SDK
-      WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
-
-      # Note: Object search requires Unity Catalog and specific permissions
-      # This is a placeholder for the concept
-      return {
-        'success': True,
-        'query': query,
-        'object_types': object_types,
-        'message': 'Unity Catalog object search initiated',
-        'note': (
-          'Object search requires Unity Catalog and specific permissions, '
-          'may not be directly accessible via SDK'
-        ),
-        'results': [],
-        'count': 0,
-      }
-
-    except Exception as e:
-      print(f'❌ Error searching Unity Catalog objects: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+    # Note: Object search requires Unity Catalog and specific permissions
+    # This is a placeholder for the concept
+    return {
+      'success': True,
+      'query': query,
+      'object_types': object_types,
+      'message': 'Unity Catalog object search initiated',
+      'note': (
+        'Object search requires Unity Catalog and specific permissions, '
+        'may not be directly accessible via SDK'
+      ),
+      'results': [],
+      'count': 0,
+    }
 
   @mcp_server.tool()
   def get_table_statistics(table_name: str) -> dict:
@@ -734,34 +648,24 @@ def load_uc_tools(mcp_server):
     Returns:
         Dictionary with table statistics or error message
     """
-    try:
-      # Parse table name
-      parts = table_name.split('.')
-      if len(parts) != 3:
-        return {'success': False, 'error': 'Table name must be in format: catalog.schema.table'}
-
-      catalog_name, schema_name, table_name_only = parts
-
-      # Initialize Databricks SDK
-      WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
-
-      # Note: Table statistics require specific permissions
-      # This is a placeholder for the concept
-      return {
-        'success': True,
-        'table_name': table_name,
-        'message': f'Table statistics retrieval initiated for {table_name}',
-        'note': (
-          'Table statistics require specific permissions and may not be directly accessible via SDK'
-        ),
-        'statistics': {},
-      }
-
-    except Exception as e:
-      print(f'❌ Error getting table statistics: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+    # Parse table name
+    parts = table_name.split('.')
+    if len(parts) != 3:
+      return {'success': False, 'error': 'Table name must be in format: catalog.schema.table'}
+
+    catalog_name, schema_name, table_name_only = parts
+
+    # Note: Table statistics require specific permissions
+    # This is a placeholder for the concept
+    return {
+      'success': True,
+      'table_name': table_name,
+      'message': f'Table statistics retrieval initiated for {table_name}',
+      'note': (
+        'Table statistics require specific permissions and may not be directly accessible via SDK'
+      ),
+      'statistics': {},
+    }
 
   @mcp_server.tool()
   def list_metastores() -> dict:
@@ -772,9 +676,7 @@ def load_uc_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # List metastores
       metastores = w.metastores.list()
@@ -801,8 +703,8 @@ def load_uc_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error listing metastores: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}', 'metastores': [], 'count': 0}
+      logger.error('Error listing metastores: %s', e)
+      return {'success': False, 'error': f'Error: {e}', 'metastores': [], 'count': 0}
 
   @mcp_server.tool()
   def describe_metastore(metastore_name: str) -> dict:
@@ -816,9 +718,7 @@ def load_uc_tools(mcp_server):
     """
     try:
       # Initialize Databricks SDK
-      w = WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
+      w = get_workspace_client(WorkspaceClient)
 
       # Get metastore details
       metastore = w.metastores.get(metastore_name)
@@ -844,8 +744,8 @@ def load_uc_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error describing metastore: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+      logger.error('Error describing metastore: %s', e)
+      return {'success': False, 'error': f'Error: {e}'}
 
   @mcp_server.tool()
   def list_data_quality_monitors(catalog_name: str = None) -> dict:
@@ -857,31 +757,21 @@ def load_uc_tools(mcp_server):
     Returns:
         Dictionary with monitor listings or error message
     """
-    try:
-      # Initialize Databricks SDK
-      WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
-
-      # Note: Data quality monitors require specific permissions
-      # This is a placeholder for the concept
-      return {
-        'success': True,
-        'catalog': catalog_name,
-        'message': f'Data quality monitor listing initiated for catalog {catalog_name}'
-        if catalog_name
-        else 'Data quality monitor listing initiated for all catalogs',
-        'note': (
-          'Data quality monitors require specific permissions and may not be '
-          'directly accessible via SDK'
-        ),
-        'monitors': [],
-        'count': 0,
-      }
-
-    except Exception as e:
-      print(f'❌ Error listing data quality monitors: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}', 'monitors': [], 'count': 0}
+    # Note: Data quality monitors require specific permissions
+    # This is a placeholder for the concept
+    return {
+      'success': True,
+      'catalog': catalog_name,
+      'message': f'Data quality monitor listing initiated for catalog {catalog_name}'
+      if catalog_name
+      else 'Data quality monitor listing initiated for all catalogs',
+      'note': (
+        'Data quality monitors require specific permissions and may not be '
+        'directly accessible via SDK'
+      ),
+      'monitors': [],
+      'count': 0,
+    }
 
   @mcp_server.tool()
   def get_data_quality_results(monitor_name: str, date_range: str = '7d') -> dict:
@@ -894,29 +784,19 @@ def load_uc_tools(mcp_server):
     Returns:
         Dictionary with monitoring results or error message
     """
-    try:
-      # Initialize Databricks SDK
-      WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
-
-      # Note: Data quality results require specific permissions
-      # This is a placeholder for the concept
-      return {
-        'success': True,
-        'monitor_name': monitor_name,
-        'date_range': date_range,
-        'message': f'Data quality results retrieval initiated for {monitor_name}',
-        'note': (
-          'Data quality results require specific permissions and may not be '
-          'directly accessible via SDK'
-        ),
-        'results': {},
-      }
-
-    except Exception as e:
-      print(f'❌ Error getting data quality results: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+    # Note: Data quality results require specific permissions
+    # This is a placeholder for the concept
+    return {
+      'success': True,
+      'monitor_name': monitor_name,
+      'date_range': date_range,
+      'message': f'Data quality results retrieval initiated for {monitor_name}',
+      'note': (
+        'Data quality results require specific permissions and may not be '
+        'directly accessible via SDK'
+      ),
+      'results': {},
+    }
 
   @mcp_server.tool()
   def create_data_quality_monitor(table_name: str, rules: list) -> dict:
@@ -929,25 +809,15 @@ def load_uc_tools(mcp_server):
     Returns:
         Dictionary with operation result or error message
     """
-    try:
-      # Initialize Databricks SDK
-      WorkspaceClient(
-        host=os.environ.get('DATABRICKS_HOST'), token=os.environ.get('DATABRICKS_TOKEN')
-      )
-
-      # Note: Data quality monitor creation requires specific permissions
-      # This is a placeholder for the concept
-      return {
-        'success': True,
-        'table_name': table_name,
-        'rules': rules,
-        'message': f'Data quality monitor creation initiated for {table_name}',
-        'note': (
-          'Data quality monitor creation requires specific permissions and may not be '
-          'directly accessible via SDK'
-        ),
-      }
-
-    except Exception as e:
-      print(f'❌ Error creating data quality monitor: {str(e)}')
-      return {'success': False, 'error': f'Error: {str(e)}'}
+    # Note: Data quality monitor creation requires specific permissions
+    # This is a placeholder for the concept
+    return {
+      'success': True,
+      'table_name': table_name,
+      'rules': rules,
+      'message': f'Data quality monitor creation initiated for {table_name}',
+      'note': (
+        'Data quality monitor creation requires specific permissions and may not be '
+        'directly accessible via SDK'
+      ),
+    }
@@ -1,31 +1,139 @@
 """Simple utility functions for MCP tools."""
 
+import functools
+import os
 import re
+import time
+
+# Redactions in the order they are applied. Later patterns see the output of
+# earlier ones, which matters when matches overlap (e.g. "token abc-dapi123").
+_REDACTIONS = (
+  (re.compile(r'dapi[a-zA-Z0-9\-_]+'), '[TOKEN_REDACTED]'),
+  (re.compile(r'Bearer [a-zA-Z0-9\-_\.]+'), 'Bearer [TOKEN_REDACTED]'),
+  (re.compile(r'token [a-zA-Z0-9\-_]+'), 'token [REDACTED]'),
+  (re.compile(r'/Users/[^/\s]+'), '/Users/[USER]'),
+  (re.compile(r'/home/[^/\s]+'), '/home/[USER]'),
+  (re.compile(r'server\.tools\.[a-zA-Z_\.]+'), 'server.tools.[MODULE]'),
+)
+
+# Every redaction pattern in one alternation. It matches somewhere exactly when
+# at least one redaction would apply, so clean messages are scanned only once.
+_SENSITIVE_RE = re.compile('|'.join(pattern.pattern for pattern, _ in _REDACTIONS))
 
 
 def sanitize_error_message(error_msg: str) -> str:
   """Remove sensitive information from error messages.
 
+  Redacts Databricks and bearer tokens, user home paths and internal
+  ``server.tools`` module paths. Messages with nothing to redact are
+  returned after a single scan.
+
   Args:
       error_msg: The raw error message
 
   Returns:
       Sanitized error message with sensitive data removed
   """
-  # Remove Databricks tokens (dapi... format)
-  error_msg = re.sub(r'dapi[a-zA-Z0-9\-_]+', '[TOKEN_REDACTED]', error_msg)
+  if _SENSITIVE_RE.search(error_msg) is None:
+    return error_msg
+  for pattern, replacement in _REDACTIONS:
+    error_msg = pattern.sub(replacement, error_msg)
+  return error_msg
 
-  # Remove bearer tokens
-  error_msg = re.sub(r'Bearer [a-zA-Z0-9\-_\.]+', 'Bearer [TOKEN_REDACTED]', error_msg)
 
-  # Remove general token patterns
-  error_msg = re.sub(r'token [a-zA-Z0-9\-_]+', 'token [REDACTED]', error_msg)
+# Connections kept alive per host by the SDK's HTTP session; override with
+# DATABRICKS_POOL_SIZE when many tool calls run concurrently
+DEFAULT_CONNECTION_POOL_SIZE = 32
 
-  # Remove file paths that might contain usernames
-  error_msg = re.sub(r'/Users/[^/\s]+', '/Users/[USER]', error_msg)
-  error_msg = re.sub(r'/home/[^/\s]+', '/home/[USER]', error_msg)
 
-  # Remove server.tools internal paths
-  error_msg = re.sub(r'server\.tools\.[a-zA-Z_\.]+', 'server.tools.[MODULE]', error_msg)
+@functools.lru_cache(maxsize=4)
+def _cached_workspace_client(client_cls, host: str, token: str, pool_size: int):
+  """Build the workspace client for one class/host/token/pool size combination."""
+  from databricks.sdk.core import Config
 
-  return error_msg
+  # The SDK passes max_connection_pools to requests' pool_maxsize (connections
+  # kept per host) and max_connections_per_pool to pool_connections (host pools
+  # cached); the former is what sizes the keep-alive pool
+  config = Config(
+    host=host,
+    token=token,
+    max_connection_pools=pool_size,
+    max_connections_per_pool=pool_size,
+  )
+  return client_cls(config=config)
+
+
+def _connection_pool_size() -> int:
+  """Read DATABRICKS_POOL_SIZE, falling back to the default when unset or invalid."""
+  try:
+    return int(os.environ.get('DATABRICKS_POOL_SIZE', DEFAULT_CONNECTION_POOL_SIZE))
+  except ValueError:
+    return DEFAULT_CONNECTION_POOL_SIZE
+
+
+def get_workspace_client(client_cls=None):
+  """Return a WorkspaceClient for the configured workspace.
+
+  The client is created once and reused across tool calls so its config
+  resolution and HTTP connection pool are not rebuilt on every call. It is
+  keyed on DATABRICKS_HOST, DATABRICKS_TOKEN and DATABRICKS_POOL_SIZE, so
+  changing any of them transparently yields a fresh client.
+
+  Args:
+      client_cls: Client class to instantiate. Tool modules that import
+          ``WorkspaceClient`` themselves pass it in so the cache follows that
+          name (including when it is patched). Defaults to
+          ``databricks.sdk.WorkspaceClient``, imported on first use.
+
+  Returns:
+      Shared databricks.sdk.WorkspaceClient instance
+  """
+  if client_cls is None:
+    from databricks.sdk import WorkspaceClient as client_cls
+  return _cached_workspace_client(
+    client_cls,
+    os.environ.get('DATABRICKS_HOST'),
+    os.environ.get('DATABRICKS_TOKEN'),
+    _connection_pool_size(),
+  )
+
+
+# Statement states that mean the warehouse has not finished executing yet
+_PENDING_STATEMENT_STATES = frozenset({'PENDING', 'RUNNING'})
+
+
+def statement_state(response):
+  """Return a statement response's state name, or None if it has none."""
+  state = getattr(getattr(response, 'status', None), 'state', None)
+  return getattr(state, 'value', state)
+
+
+def wait_for_statement(
+  client, response, timeout: float = 25.0, initial_delay: float = 0.1, max_delay: float = 2.0
+):
+  """Poll a submitted SQL statement until it is no longer pending or running.
+
+  Callers submit with a short ``wait_timeout`` so fast queries come back on the
+  first response; slower ones are polled here with exponential backoff rather
+  than holding a long server-side wait.
+
+  Args:
+      client: WorkspaceClient used to submit the statement
+      response: Response returned by ``statement_execution.execute_statement``
+      timeout: Seconds to keep polling before giving up
+      initial_delay: Seconds before the first poll
+      max_delay: Upper bound on the delay between polls
+
+  Returns:
+      Latest statement response; still pending or running if the timeout elapsed
+  """
+  deadline = time.monotonic() + timeout
+  delay = initial_delay
+  while statement_state(response) in _PENDING_STATEMENT_STATES:
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+      break
+    time.sleep(min(delay, remaining))
+    response = client.statement_execution.get_statement(response.statement_id)
+    delay = min(delay * 2, max_delay)
+  return response
@@ -4,8 +4,10 @@ Simple, direct widget creation with proper Lakeview JSON structure.
 Supports all 16 widget types with correct encodings and specifications.
 """
 
+import functools
+import re
 import uuid
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 # Widget version mapping according to schema requirements
 # Each widget type has a specific version that matches Lakeview's schema expectations
@@ -44,7 +46,7 @@ def generate_id() -> str:
   Lakeview requires unique identifiers for widgets, datasets, and other objects.
   This function creates short, readable IDs by truncating UUID4 strings.
   """
-  return str(uuid.uuid4())[:8]
+  return uuid.uuid4().hex[:8]
 
 
 # Simple SQL Expression Helper Functions (Phase 1 Enhancement)
@@ -117,6 +119,13 @@ def get_count_star_expression() -> str:
   return 'COUNT(`*`)'
 
 
+# SQL fragments rejected in widget expressions, in reporting order
+DANGEROUS_EXPRESSION_PATTERNS = ('DROP', 'DELETE', 'UPDATE', 'INSERT', '--', ';')
+_DANGEROUS_EXPRESSION_RE = re.compile(
+  '|'.join(re.escape(pattern) for pattern in DANGEROUS_EXPRESSION_PATTERNS), re.IGNORECASE
+)
+
+
 def validate_expression_basic(expression: str) -> Dict[str, Any]:
   """Simple validation for common SQL patterns - no complex schemas.
 
@@ -136,21 +145,22 @@ def validate_expression_basic(expression: str) -> Dict[str, Any]:
       }
   """
   try:
-    # Basic checks for SQL injection patterns - prevent dangerous operations
-    dangerous_patterns = ['DROP', 'DELETE', 'UPDATE', 'INSERT', '--', ';']
-    expression_upper = expression.upper()
-
-    # Scan for potentially harmful SQL keywords
-    for pattern in dangerous_patterns:
-      if pattern in expression_upper:
-        return {'valid': False, 'error': f'Potentially dangerous pattern: {pattern}'}
+    # Basic checks for SQL injection patterns - prevent dangerous operations.
+    # Clean expressions are cleared by one case-insensitive scan; only a hit pays
+    # for the upper-cased copy needed to report the first pattern in order.
+    if _DANGEROUS_EXPRESSION_RE.search(expression):
+      expression_upper = expression.upper()
+      for pattern in DANGEROUS_EXPRESSION_PATTERNS:
+        if pattern in expression_upper:
+          return {'valid': False, 'error': f'Potentially dangerous pattern: {pattern}'}
 
     # Check for basic SQL structure - fields should be backtick-quoted in Databricks
     if '`' not in expression and expression != 'COUNT(`*)':
       return {'valid': False, 'error': 'Expression should reference fields with backticks'}
 
     return {'valid': True, 'error': None}
-  except Exception as e:
+  except TypeError as e:
+    # Non-string expressions cannot be scanned
     return {'valid': False, 'error': str(e)}
 
 
@@ -177,6 +187,21 @@ def find_dataset_id(dataset_name: str, datasets: List[Dict[str, Any]]) -> str:
   return datasets[0]['name'] if datasets else generate_id()
 
 
+@functools.lru_cache(maxsize=None)
+def _encoding_config_keys(encoding_type: str) -> Tuple[str, str, str, str]:
+  """Config keys read for an encoding type, formatted once per type.
+
+  Returns:
+      Tuple of (scale_type, sort, axis_title, display_name) config keys
+  """
+  return (
+    f'{encoding_type}_scale_type',
+    f'{encoding_type}_sort',
+    f'{encoding_type}_axis_title',
+    f'{encoding_type}_display_name',
+  )
+
+
 def create_standard_axis_encoding(
   field_name: str, scale_type: str, config: Dict, encoding_type: str = None
 ) -> Dict:
@@ -199,7 +224,7 @@ def create_standard_axis_encoding(
 
   # Add display name for user-friendly axis labels
   if encoding_type:
-    display_name_key = f'{encoding_type}_display_name'
+    _, sort_key, axis_title_key, display_name_key = _encoding_config_keys(encoding_type)
     if display_name_key in config:
       encoding['displayName'] = config[display_name_key]
     else:
@@ -209,13 +234,11 @@ def create_standard_axis_encoding(
 
   # Add axis configuration if custom title is specified
   if encoding_type:
-    axis_title_key = f'{encoding_type}_axis_title'
     if axis_title_key in config:
       encoding['axis'] = {'title': config[axis_title_key]}
 
   # Add sort configuration for categorical scales (for ordering categories)
   if scale_type == 'categorical' and encoding_type:
-    sort_key = f'{encoding_type}_sort'
     if sort_key in config:
       encoding['scale']['sort'] = {'by': config[sort_key]}
 
@@ -270,8 +293,10 @@ def create_advanced_encoding(
   """
   encoding = {'fieldName': field_name}
 
+  # Config key names for this encoding type are formatted once and reused
+  scale_key, sort_key, axis_title_key, display_name_key = _encoding_config_keys(encoding_type)
+
   # Determine scale type from config or use intelligent defaults
-  scale_key = f'{encoding_type}_scale_type'
   scale_type = config.get(scale_key)
 
   # Set default scale types based on encoding type if not explicitly provided
@@ -293,19 +318,16 @@ def create_advanced_encoding(
 
     # Add sort configuration for categorical scales (controls category ordering)
     if scale_type == 'categorical':
-      sort_key = f'{encoding_type}_sort'
       if sort_key in config:
         scale['sort'] = {'by': config[sort_key]}
 
     encoding['scale'] = scale
 
   # Add axis configuration for custom axis titles
-  axis_title_key = f'{encoding_type}_axis_title'
   if axis_title_key in config:
     encoding['axis'] = {'title': config[axis_title_key]}
 
   # Add display name for user-friendly labels
-  display_name_key = f'{encoding_type}_display_name'
   if display_name_key in config:
     encoding['displayName'] = config[display_name_key]
   else:
@@ -340,6 +362,31 @@ def create_frame_config(config: Dict[str, Any]) -> Dict[str, Any]:
   return frame
 
 
+# Sentinel for single-lookup dict.get() checks where None is a valid config value
+_MISSING = object()
+
+# Standard field keys that widgets commonly use, paired with the config key of
+# their optional custom SQL expression. Each corresponds to a different encoding
+# type (x-axis, y-axis, color, etc.)
+QUERY_FIELD_KEYS = tuple(
+  (field_key, field_key.replace('_field', '_expression'))
+  for field_key in (
+    'x_field',  # X-axis field for charts
+    'y_field',  # Y-axis field for charts
+    'color_field',  # Color grouping field
+    'size_field',  # Size encoding field (for bubble charts, etc.)
+    'value_field',  # Value field for counters, pie charts
+    'category_field',  # Category field for pie charts, filters
+    'source_field',  # Source field for Sankey diagrams
+    'target_field',  # Target field for Sankey diagrams
+    'stage_field',  # Stage field for funnel charts
+    'location_field',  # Location field for maps
+    'latitude_field',  # Latitude field for symbol maps
+    'longitude_field',  # Longitude field for symbol maps
+  )
+)
+
+
 def create_widget_queries(
   widget_config: Dict[str, Any], datasets: List[Dict]
 ) -> List[Dict[str, Any]]:
@@ -371,29 +418,14 @@ def create_widget_queries(
   fields = []
 
   # Standard field keys that widgets commonly use
-  # Each corresponds to a different encoding type (x-axis, y-axis, color, etc.)
-  for field_key in [
-    'x_field',  # X-axis field for charts
-    'y_field',  # Y-axis field for charts
-    'color_field',  # Color grouping field
-    'size_field',  # Size encoding field (for bubble charts, etc.)
-    'value_field',  # Value field for counters, pie charts
-    'category_field',  # Category field for pie charts, filters
-    'source_field',  # Source field for Sankey diagrams
-    'target_field',  # Target field for Sankey diagrams
-    'stage_field',  # Stage field for funnel charts
-    'location_field',  # Location field for maps
-    'latitude_field',  # Latitude field for symbol maps
-    'longitude_field',  # Longitude field for symbol maps
-  ]:
-    if field_key in config:
-      field_name = config[field_key]
-
+  for field_key, expression_key in QUERY_FIELD_KEYS:
+    field_name = config.get(field_key, _MISSING)
+    if field_name is not _MISSING:
       # Check if there's a custom SQL expression for this field
-      expression_key = field_key.replace('_field', '_expression')
-      if expression_key in config:
+      expression = config.get(expression_key, _MISSING)
+      if expression is not _MISSING:
         # Use custom expression (e.g., "SUM(`revenue`)", "DATE_TRUNC('MONTH', `date`)")
-        fields.append({'name': field_name, 'expression': config[expression_key]})
+        fields.append({'name': field_name, 'expression': expression})
       else:
         # Default expression: direct field reference with backticks (Databricks standard)
         # This matches the format seen in example dashboards: "`field_name`"
@@ -449,71 +481,14 @@ def create_widget_spec(
   """
   widget_type = widget_config.get('type', 'table')  # Default to table if type not specified
 
-  # Chart widgets - visualization types for data analysis
-  if widget_type == 'bar':
-    return create_advanced_bar_widget(widget_config, datasets)
-  elif widget_type == 'line':
-    return create_advanced_line_widget(widget_config, datasets)
-  elif widget_type == 'area':
-    return create_advanced_area_widget(widget_config, datasets)
-  elif widget_type == 'scatter':
-    return create_advanced_scatter_widget(widget_config, datasets)
-  elif widget_type == 'pie':
-    return create_advanced_pie_widget(widget_config, datasets)
-  elif widget_type == 'histogram':
-    return create_advanced_histogram_widget(widget_config, datasets)
-  elif widget_type == 'heatmap':
-    return create_advanced_heatmap_widget(widget_config, datasets)
-  elif widget_type == 'box':
-    return create_box_widget(widget_config, datasets)
-  elif widget_type == 'sankey':
-    return create_sankey_widget(widget_config, datasets)
-  elif widget_type == 'choropleth-map':
-    return create_choropleth_widget(widget_config, datasets)
-  elif widget_type == 'symbol-map':
-    return create_symbol_map_widget(widget_config, datasets)
-  elif widget_type == 'funnel':
-    return create_funnel_widget(widget_config, datasets)
-  elif widget_type == 'combo':
-    return create_combo_widget(widget_config, datasets)
-  elif widget_type == 'range-slider':
-    return create_range_slider_widget(widget_config, datasets)
-
-  # Display widgets - for showing data in tabular or summary formats
-  elif widget_type == 'counter':
-    return create_advanced_counter_widget(widget_config, datasets)
-  elif widget_type == 'table':
-    return create_advanced_table_widget(widget_config, datasets)
-  elif widget_type == 'pivot':
-    return create_advanced_pivot_widget(widget_config, datasets)
-  elif widget_type == 'text':
-    return create_advanced_text_widget(widget_config, datasets)
-
-  # Filter widgets - Standardized versions with parameter support for dashboard interactivity
-  elif widget_type == 'filter-single-select':
-    return create_filter_single_select_widget(widget_config, datasets, dashboard_id)
-  elif widget_type == 'filter-multi-select':
-    return create_filter_multi_select_widget(widget_config, datasets, dashboard_id)
-  elif widget_type == 'filter-date-range-picker':
-    return create_filter_date_range_widget(widget_config, datasets, dashboard_id)
-  elif widget_type == 'filter-date-range':  # Legacy compatibility
-    return create_filter_date_range_widget(widget_config, datasets, dashboard_id)
-
-  # Legacy filter widget names (for backward compatibility with older configurations)
-  elif widget_type == 'dropdown':
-    return create_filter_single_select_widget(widget_config, datasets, dashboard_id)
-  elif widget_type == 'multi_select':
-    return create_filter_multi_select_widget(widget_config, datasets, dashboard_id)
-  elif widget_type == 'date_range':
-    return create_filter_date_range_widget(widget_config, datasets, dashboard_id)
-  elif widget_type == 'slider':
-    return create_slider_widget(widget_config, datasets)
-  elif widget_type == 'text_search':
-    return create_text_search_widget(widget_config, datasets)
+  # Filter widgets need the dashboard ID for parameter generation
+  filter_builder = FILTER_WIDGET_BUILDERS.get(widget_type)
+  if filter_builder is not None:
+    return filter_builder(widget_config, datasets, dashboard_id)
 
-  else:
-    # Default fallback: create table widget for unknown types
-    return create_advanced_table_widget(widget_config, datasets)
+  # Default fallback: create table widget for unknown types
+  builder = WIDGET_BUILDERS.get(widget_type, create_advanced_table_widget)
+  return builder(widget_config, datasets)
 
 
 # Advanced Chart Widgets
@@ -782,30 +757,27 @@ def create_advanced_histogram_widget(config: Dict, datasets: List[Dict]) -> Dict
 
   # Prepare config for query generation with proper binned fields
   # This is critical: the query must provide the exact fields that encodings reference
-  updated_config = config.copy()
-  histogram_config = widget_config.copy()
-
-  # Critical fix: Ensure the query fields match the encoding fieldNames exactly
+  binned_fields = {}
   if 'x_field' in widget_config:
     x_field = widget_config['x_field']
     bin_width = widget_config.get('bin_width', 10)
 
-    # The binned field name must match what's in encodings
-    binned_field = f'bin({x_field}, binWidth={bin_width})'
-
-    # Set up both the field name and expression for the binned field
-    histogram_config['x_field'] = binned_field  # This matches the encoding fieldName
-    histogram_config['x_expression'] = get_bin_expression(
-      x_field, bin_width
-    )  # This is the actual SQL expression: BIN_FLOOR(`field`, width)
+    # The binned field name must match what's in encodings, and its
+    # expression is the actual SQL: BIN_FLOOR(`field`, width)
+    binned_fields = {
+      'x_field': f'bin({x_field}, binWidth={bin_width})',
+      'x_expression': get_bin_expression(x_field, bin_width),
+    }
 
-  # Set up count field with proper expression
-  histogram_config['y_field'] = y_field
-  histogram_config['y_expression'] = (
-    get_count_star_expression() if y_field == 'count(*)' else y_field
-  )
+  # Build the query config in one merge, including the count field expression
+  histogram_config = {
+    **widget_config,
+    **binned_fields,
+    'y_field': y_field,
+    'y_expression': get_count_star_expression() if y_field == 'count(*)' else y_field,
+  }
 
-  updated_config['config'] = histogram_config
+  updated_config = {**config, 'config': histogram_config}
 
   return {
     'name': generate_id(),
@@ -1416,6 +1388,23 @@ def create_box_widget(config: Dict, datasets: List[Dict]) -> Dict[str, Any]:
   return {'name': generate_id(), 'spec': spec, 'queries': create_widget_queries(config, datasets)}
 
 
+# Map choropleth geo_type to geographic role
+GEO_ROLE_MAPPING = {
+  'country': 'admin0-unit-code',
+  'state': 'admin1-unit-code',
+  'county': 'admin2-unit-code',
+  'zipcode': 'zipcode',
+}
+
+# Map choropleth geo_type to admin level
+ADMIN_LEVEL_MAPPING = {
+  'country': 'admin0',
+  'state': 'admin1',
+  'county': 'admin2',
+  'zipcode': 'zipcode',
+}
+
+
 def create_choropleth_widget(config: Dict, datasets: List[Dict]) -> Dict[str, Any]:
   """Create choropleth map widget with proper region encoding structure."""
   widget_config = config.get('config', {})
@@ -1433,24 +1422,8 @@ def create_choropleth_widget(config: Dict, datasets: List[Dict]) -> Dict[str, An
     location_field = widget_config['location_field']
     geo_type = widget_config.get('geo_type', 'state')  # Default to state
 
-    # Map geo_type to geographic role
-    geo_role_mapping = {
-      'country': 'admin0-unit-code',
-      'state': 'admin1-unit-code',
-      'county': 'admin2-unit-code',
-      'zipcode': 'zipcode',
-    }
-
-    # Map geo_type to admin level
-    admin_level_mapping = {
-      'country': 'admin0',
-      'state': 'admin1',
-      'county': 'admin2',
-      'zipcode': 'zipcode',
-    }
-
-    geo_role = geo_role_mapping.get(geo_type, 'admin1-unit-code')
-    admin_level = admin_level_mapping.get(geo_type, 'admin1')
+    geo_role = GEO_ROLE_MAPPING.get(geo_type, 'admin1-unit-code')
+    admin_level = ADMIN_LEVEL_MAPPING.get(geo_type, 'admin1')
 
     encodings['region'] = {
       'regionType': 'mapbox-v4-admin',
@@ -1458,7 +1431,9 @@ def create_choropleth_widget(config: Dict, datasets: List[Dict]) -> Dict[str, An
         'fieldName': location_field,
         'type': 'field',
         'geographicRole': geo_role,
-        'displayName': widget_config.get('location_display_name', location_field.title()),
+        'displayName': widget_config['location_display_name']
+        if 'location_display_name' in widget_config
+        else location_field.title(),
       },
     }
 
@@ -1808,3 +1783,50 @@ def create_range_slider_widget(config: Dict, datasets: List[Dict]) -> Dict[str,
     },
     'queries': create_widget_queries(config, datasets),
   }
+
+
+# Widget factory dispatch tables used by create_widget_spec.
+# Built once after every builder is defined, so routing a widget is a single lookup.
+WIDGET_BUILDERS = {
+  # Chart widgets - visualization types for data analysis
+  'bar': create_advanced_bar_widget,
+  'line': create_advanced_line_widget,
+  'area': create_advanced_area_widget,
+  'scatter': create_advanced_scatter_widget,
+  'pie': create_advanced_pie_widget,
+  'histogram': create_advanced_histogram_widget,
+  'heatmap': create_advanced_heatmap_widget,
+  'box': create_box_widget,
+  'sankey': create_sankey_widget,
+  'choropleth-map': create_choropleth_widget,
+  'symbol-map': create_symbol_map_widget,
+  'funnel': create_funnel_widget,
+  'combo': create_combo_widget,
+  'range-slider': create_range_slider_widget,
+  # Display widgets - for showing data in tabular or summary formats
+  'counter': create_advanced_counter_widget,
+  'table': create_advanced_table_widget,
+  'pivot': create_advanced_pivot_widget,
+  'text': create_advanced_text_widget,
+  # Legacy filter widget names without parameter support
+  'slider': create_slider_widget,
+  'text_search': create_text_search_widget,
+}
+
+# Filter widgets - Standardized versions with parameter support for dashboard interactivity
+FILTER_WIDGET_BUILDERS = {
+  'filter-single-select': create_filter_single_select_widget,
+  'filter-multi-select': create_filter_multi_select_widget,
+  'filter-date-range-picker': create_filter_date_range_widget,
+  'filter-date-range': create_filter_date_range_widget,  # Legacy compatibility
+  # Legacy filter widget names (for backward compatibility with older configurations)
+  'dropdown': create_filter_single_select_widget,
+  'multi_select': create_filter_multi_select_widget,
+  'date_range': create_filter_date_range_widget,
+}
+
+# Every widget type accepted by create_widget_spec, including legacy aliases
+SUPPORTED_WIDGET_TYPES = frozenset(WIDGET_BUILDERS) | frozenset(FILTER_WIDGET_BUILDERS)
+
+# Scale types accepted for '<encoding>_scale_type' config values
+SUPPORTED_SCALE_TYPES = frozenset({'categorical', 'quantitative', 'temporal'})
@@ -3,6 +3,11 @@
 import pytest
 
 from server.tools.core import load_core_tools
+from server.tools.utils import (
+  DEFAULT_CONNECTION_POOL_SIZE,
+  get_workspace_client,
+  sanitize_error_message,
+)
 
 
 class TestCoreTools:
@@ -34,3 +39,43 @@ class TestCoreTools:
     tools = mcp_server._tool_manager._tools
     assert 'health' in tools
     assert len(tools) == 1  # Only health tool exists
+
+
+class TestErrorSanitization:
+  """Test error message sanitization."""
+
+  @pytest.mark.unit
+  def test_overlapping_token_patterns(self):
+    """Test that overlapping token and PAT matches are redacted pattern by pattern."""
+    assert sanitize_error_message('token abc-dapi123') == 'token [REDACTED][TOKEN_REDACTED]'
+    assert sanitize_error_message('token dapi123') == 'token [TOKEN_REDACTED]'
+    assert sanitize_error_message('/home/token abc') == '/home/[USER] [REDACTED]'
+    assert sanitize_error_message('Warehouse not found') == 'Warehouse not found'
+
+
+class TestWorkspaceClient:
+  """Test the shared workspace client."""
+
+  @pytest.mark.unit
+  def test_pool_size_sets_connections_per_host(self, mock_env_vars, monkeypatch):
+    """Test that DATABRICKS_POOL_SIZE sizes the per-host connection pool."""
+    monkeypatch.setenv('DATABRICKS_POOL_SIZE', '64')
+
+    client = get_workspace_client()
+    adapter = client.api_client._api_client._session.get_adapter(
+      'https://test.cloud.databricks.com'
+    )
+
+    assert adapter._pool_maxsize == 64
+
+  @pytest.mark.unit
+  def test_invalid_pool_size_falls_back_to_default(self, mock_env_vars, monkeypatch):
+    """Test that a non-numeric DATABRICKS_POOL_SIZE uses the default pool size."""
+    monkeypatch.setenv('DATABRICKS_POOL_SIZE', 'lots')
+
+    client = get_workspace_client()
+    adapter = client.api_client._api_client._session.get_adapter(
+      'https://test.cloud.databricks.com'
+    )
+
+    assert adapter._pool_maxsize == DEFAULT_CONNECTION_POOL_SIZE
@@ -1,10 +1,14 @@
 """Consolidated dashboard tests following CLAUDE.md simplicity guidelines."""
 
+import asyncio
+import json
 import tempfile
+from unittest.mock import Mock, patch
 
 import pytest
 
-from server.tools.lakeview_dashboard import load_dashboard_tools
+from server.tools import utils
+from server.tools.lakeview_dashboard import load_dashboard_tools, validate_sql_query
 
 
 class TestDashboardCreation:
@@ -112,6 +116,28 @@ class TestDashboardCreation:
       assert result['success'] is True
       assert 'file_path' in result
 
+  @pytest.mark.unit
+  def test_dashboard_file_matches_json_encoding(self, mcp_server, mock_env_vars):
+    """Test that dashboard files are written exactly as json.dumps(indent=2) encodes them."""
+    load_dashboard_tools(mcp_server)
+    tool = mcp_server._tool_manager._tools['create_dashboard_file']
+
+    with tempfile.NamedTemporaryFile(suffix='.lvdash.json', delete=False) as temp_file:
+      result = tool.fn(
+        name='Café Dashboard',
+        warehouse_id='test-warehouse',
+        datasets=[{'name': 'Ventes', 'query': 'SELECT région, revenue FROM sales'}],
+        widgets=[{'type': 'counter', 'dataset': 'Ventes', 'config': {'value_field': 'revenue'}}],
+        file_path=temp_file.name,
+        validate_sql=False,
+      )
+
+      assert result['success'] is True
+      with open(result['file_path'], 'rb') as f:
+        written = f.read()
+      assert written == json.dumps(json.loads(written), indent=2).encode('utf-8')
+      assert b'\\u00e9' in written  # Non-ASCII characters are escaped
+
 
 class TestDashboardValidation:
   """Test dashboard validation functionality."""
@@ -140,6 +166,138 @@ class TestDashboardValidation:
       assert result['success'] is True
       assert 'file_path' in result
 
+  @pytest.mark.unit
+  def test_unsupported_widget_type_rejected(self, mcp_server, mock_env_vars):
+    """Test that unsupported widget types fail before any SQL validation."""
+    load_dashboard_tools(mcp_server)
+    tool = mcp_server._tool_manager._tools['create_dashboard_file']
+
+    with tempfile.NamedTemporaryFile(suffix='.lvdash.json', delete=False) as temp_file:
+      result = tool.fn(
+        name='Test Dashboard',
+        warehouse_id='test-warehouse',
+        datasets=[{'name': 'Test Data', 'query': 'SELECT * FROM any_table'}],
+        widgets=[{'type': 'sparkline', 'dataset': 'Test Data', 'config': {}}],
+        file_path=temp_file.name,
+        validate_sql=True,  # Would need a warehouse if the check ran late
+      )
+
+      assert result['success'] is False
+      assert "Unsupported widget type 'sparkline'" in result['error']
+
+  @pytest.mark.unit
+  def test_missing_required_widget_field_rejected(self, mcp_server, mock_env_vars):
+    """Test that widgets missing required config fields fail before SQL validation."""
+    load_dashboard_tools(mcp_server)
+    tool = mcp_server._tool_manager._tools['create_dashboard_file']
+
+    with tempfile.NamedTemporaryFile(suffix='.lvdash.json', delete=False) as temp_file:
+      result = tool.fn(
+        name='Test Dashboard',
+        warehouse_id='test-warehouse',
+        datasets=[{'name': 'Test Data', 'query': 'SELECT month, revenue FROM sales'}],
+        widgets=[{'type': 'bar', 'dataset': 'Test Data', 'config': {'x_field': 'month'}}],
+        file_path=temp_file.name,
+        validate_sql=True,
+      )
+
+      assert result['success'] is False
+      assert 'missing required config fields: y_field' in result['error']
+
+  @pytest.mark.unit
+  def test_filter_with_fields_list_accepted(self, mcp_server, mock_env_vars):
+    """Test that filters configured with a 'fields' list pass the upfront widget checks."""
+    load_dashboard_tools(mcp_server)
+    tool = mcp_server._tool_manager._tools['create_dashboard_file']
+
+    with tempfile.NamedTemporaryFile(suffix='.lvdash.json', delete=False) as temp_file:
+      result = tool.fn(
+        name='Test Dashboard',
+        warehouse_id='test-warehouse',
+        datasets=[{'name': 'Test Data', 'query': 'SELECT region, revenue FROM sales'}],
+        widgets=[
+          {
+            'type': 'filter-multi-select',
+            'dataset': 'Test Data',
+            'config': {'fields': [{'fieldName': 'region', 'displayName': 'Region'}]},
+          }
+        ],
+        file_path=temp_file.name,
+        validate_sql=False,
+      )
+
+      assert result['success'] is True
+
+  @pytest.mark.unit
+  def test_failed_statement_is_invalid(self, mock_env_vars):
+    """Test that a statement ending in FAILED reports the query as invalid."""
+    client = Mock()
+    response = client.statement_execution.execute_statement.return_value
+    response.status.state = 'FAILED'
+    response.status.error.message = '[TABLE_OR_VIEW_NOT_FOUND] missing_table'
+
+    result = validate_sql_query('SELECT * FROM missing_table', 'test-warehouse', client=client)
+
+    assert result['valid'] is False
+    assert 'Table or view not found' in result['error']
+
+  @pytest.mark.unit
+  def test_running_statement_does_not_block_dashboard(self, mcp_server, mock_env_vars, monkeypatch):
+    """Test that a warehouse still RUNNING at the deadline is not reported as a SQL error."""
+    # Fake clock so polling reaches its deadline without really sleeping
+    now = [0.0]
+    fake_time = Mock()
+    fake_time.monotonic.side_effect = lambda: now[0]
+    fake_time.sleep.side_effect = lambda seconds: now.__setitem__(0, now[0] + seconds)
+    monkeypatch.setattr(utils, 'time', fake_time)
+
+    client = Mock()
+    running = client.statement_execution.execute_statement.return_value
+    running.status.state = 'RUNNING'
+    running.statement_id = 'stmt-1'
+    client.statement_execution.get_statement.return_value = running
+
+    result = validate_sql_query('SELECT region FROM cold_table', 'test-warehouse', client=client)
+
+    assert result['valid'] is True
+    assert result['timed_out'] is True
+    assert result['columns'] == []
+    client.statement_execution.cancel_execution.assert_called_once_with('stmt-1')
+
+    # The timed-out result is not cached, so the next attempt runs the query again
+    validate_sql_query('SELECT region FROM cold_table', 'test-warehouse', client=client)
+    assert client.statement_execution.execute_statement.call_count == 2
+
+    load_dashboard_tools(mcp_server)
+    tool = mcp_server._tool_manager._tools['create_dashboard_file']
+    with (
+      tempfile.NamedTemporaryFile(suffix='.lvdash.json', delete=False) as temp_file,
+      patch('server.tools.lakeview_dashboard.get_workspace_client', return_value=client),
+    ):
+      result = tool.fn(
+        name='Cold Warehouse Dashboard',
+        warehouse_id='test-warehouse',
+        datasets=[{'name': 'Regions', 'query': 'SELECT region FROM cold_table'}],
+        widgets=[{'type': 'table', 'dataset': 'Regions', 'config': {'columns': ['region']}}],
+        file_path=temp_file.name,
+      )
+
+    assert result['success'] is True
+    assert any(
+      'could not be validated in time' in w for w in result['validation_results']['warnings']
+    )
+
+  @pytest.mark.unit
+  def test_validate_dashboard_sql_without_datasets(self, mcp_server, mock_env_vars):
+    """Test that validating an empty dataset list succeeds with empty results."""
+    load_dashboard_tools(mcp_server)
+    tool = mcp_server._tool_manager._tools['validate_dashboard_sql']
+
+    result = asyncio.run(tool.fn(datasets=[], warehouse_id='test-warehouse'))
+
+    assert result['success'] is True
+    assert result['validation_results']['queries_validated'] == []
+
 
 class TestWidgetConfiguration:
   """Test widget configuration guide."""
@@ -169,3 +327,19 @@ class TestWidgetConfiguration:
     assert 'required_fields' in result
     assert 'optional_fields' in result
     assert 'examples' in result
+
+  @pytest.mark.unit
+  def test_guide_responses_are_independent(self, mcp_server, mock_env_vars):
+    """Test that mutating a guide response does not change later responses."""
+    load_dashboard_tools(mcp_server)
+    tool = mcp_server._tool_manager._tools['get_widget_configuration_guide']
+
+    tool.fn()['widget_categories'].clear()
+    bar_guide = tool.fn(widget_type='bar')
+    bar_guide['required_fields'].clear()
+    bar_guide['best_practices'].clear()
+
+    assert len(tool.fn()['widget_categories']) > 0
+    bar_guide = tool.fn(widget_type='bar')
+    assert bar_guide['required_fields'] == ['x_field', 'y_field']
+    assert bar_guide['best_practices']
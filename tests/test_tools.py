@@ -93,13 +93,16 @@ class TestJobsTools:
     """Test listing jobs successfully."""
     with patch('server.tools.jobs_pipelines.WorkspaceClient') as mock_client_class:
       mock_client = Mock()
-      mock_job = Mock()
-      mock_job.job_id = 123
-      mock_job.settings = Mock()
-      mock_job.settings.name = 'Test Job'
-      mock_job.created_time = 1234567890
-      mock_job.creator_user_name = 'test@example.com'
-      mock_client.jobs.list.return_value = [mock_job]
+      mock_client.api_client.do.return_value = {
+        'jobs': [
+          {
+            'job_id': 123,
+            'settings': {'name': 'Test Job'},
+            'created_time': 1234567890,
+            'creator_user_name': 'test@example.com',
+          }
+        ]
+      }
       mock_client_class.return_value = mock_client
 
       load_job_tools(mcp_server)
@@ -111,28 +114,60 @@ class TestJobsTools:
       assert len(result['jobs']) == 1
       assert result['jobs'][0]['job_id'] == 123
 
+  @pytest.mark.unit
+  def test_list_jobs_reports_next_page(self, mcp_server, mock_env_vars):
+    """Test that a listing cut off at the limit can be continued with its page token."""
+    with patch('server.tools.jobs_pipelines.WorkspaceClient') as mock_client_class:
+      mock_client = Mock()
+      mock_client.api_client.do.side_effect = [
+        {'jobs': [{'job_id': 1}, {'job_id': 2}], 'next_page_token': 'page-2'},
+        {'jobs': [{'job_id': 3}]},
+      ]
+      mock_client_class.return_value = mock_client
+
+      load_job_tools(mcp_server)
+      tool = mcp_server._tool_manager._tools['list_jobs']
+      first = tool.fn(limit=2)
+      second = tool.fn(limit=2, page_token=first['next_page_token'])
+
+      assert [job['job_id'] for job in first['jobs']] == [1, 2]
+      assert first['has_more'] is True
+      assert [job['job_id'] for job in second['jobs']] == [3]
+      assert second['has_more'] is False
+      assert second['next_page_token'] is None
+      mock_client.api_client.do.assert_called_with(
+        'GET', '/api/2.2/jobs/list', query={'limit': 2, 'page_token': 'page-2'}
+      )
+
   @pytest.mark.unit
   def test_list_pipelines_success(self, mcp_server, mock_env_vars):
     """Test listing pipelines successfully."""
     with patch('server.tools.jobs_pipelines.WorkspaceClient') as mock_client_class:
       mock_client = Mock()
-      mock_pipeline = Mock()
-      mock_pipeline.pipeline_id = 'pipeline-123'
-      mock_pipeline.name = 'Test Pipeline'
-      mock_pipeline.state = 'IDLE'
-      mock_pipeline.creator_user_name = 'test@example.com'
-      mock_pipeline.created_time = 1234567890
-      mock_client.pipelines.list_pipelines.return_value = [mock_pipeline]
+      mock_client.api_client.do.return_value = {
+        'statuses': [
+          {
+            'pipeline_id': 'pipeline-123',
+            'name': 'Test Pipeline',
+            'state': 'IDLE',
+            'creator_user_name': 'test@example.com',
+          }
+        ],
+        'next_page_token': 'page-2',
+      }
       mock_client_class.return_value = mock_client
 
       load_job_tools(mcp_server)
       tool = mcp_server._tool_manager._tools['list_pipelines']
-      result = tool.fn()
+      result = tool.fn(limit=1)
 
       assert result['success'] is True
       assert result['count'] == 1
       assert len(result['pipelines']) == 1
       assert result['pipelines'][0]['pipeline_id'] == 'pipeline-123'
+      assert result['pipelines'][0]['created_time'] is None
+      assert result['has_more'] is True
+      assert result['next_page_token'] == 'page-2'
 
 
 class TestDashboardTools: